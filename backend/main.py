@@ -7,12 +7,45 @@ intermediate activation visualization, and Grad-CAM analysis.
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
-import io
-from PIL import Image
-import numpy as np
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Set, Tuple, Union, BinaryIO, Literal
+import asyncio
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Share the cores between uvicorn worker processes instead of letting every
+# process spawn one thread per core. Must run before numpy/torch are imported.
+WEB_CONCURRENCY = max(1, int(os.environ.get('WEB_CONCURRENCY', '1')))
+TORCH_NUM_THREADS = int(os.environ.setdefault(
+    'OMP_NUM_THREADS', str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))
+))
+os.environ.setdefault('MKL_NUM_THREADS', str(TORCH_NUM_THREADS))
+
+# fp16 (CUDA) / bf16 (CPUs with native support) for /predict and /activations
+HALF_INFERENCE = os.environ.get('ALEXNET_HALF', '1') != '0'
+
+# int8 fully connected layers for /predict and /activations on CPU
+QUANTIZE_INFERENCE = os.environ.get('ALEXNET_QUANTIZE', '1') != '0'
+
+# torch.compile the prediction path instead of TorchScript (slow startup)
+COMPILE_INFERENCE = os.environ.get('ALEXNET_COMPILE', '0') == '1'
+
+# Run the prediction path with ONNX Runtime (optional dependency)
+ONNX_INFERENCE = os.environ.get('ALEXNET_ONNX', '0') == '1'
+
+# Build the model when this module is imported rather than in the startup hook
+EAGER_INIT = os.environ.get('ALEXNET_EAGER_INIT', '0') == '1'
+
+import PIL
+from PIL import Image, features as pil_features
+import orjson
+import torch
 
 from model import get_model, AlexNetVisualizer
 from utils import (
@@ -24,7 +57,8 @@ from utils import (
     create_individual_feature_maps,
     pil_to_base64,
     base64_to_pil,
-    resize_image_for_preview
+    resize_image_for_preview,
+    colorize_heatmap
 )
 
 
@@ -32,7 +66,8 @@ from utils import (
 app = FastAPI(
     title="AlexNet Vision Explorer API",
     description="Interactive CNN visualization platform for AlexNet",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -45,6 +80,11 @@ app.add_middleware(
 )
 
 
+# Encodings for returned images; JPEG is the fastest to encode but larger than
+# WebP, and PNG is kept for clients without WebP support
+ImageFormat = Literal['webp', 'jpeg', 'png']
+
+
 # Request/Response Models
 class PredictionResponse(BaseModel):
     prediction: str
@@ -65,8 +105,14 @@ class LayerInfo(BaseModel):
     neurons: Optional[int] = None
 
 
-class GradCAMRequest(BaseModel):
-    image_base64: str
+class B64ImageRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
+    image: str = Field(min_length=1)
+    image_format: ImageFormat = 'webp'
+
+
+class GradCAMRequest(B64ImageRequest):
     target_class: Optional[int] = None
     alpha: float = 0.5
 
@@ -85,45 +131,344 @@ class FilterWeightsResponse(BaseModel):
     kernel_size: List[int]
 
 
+# Static summary of the AlexNet architecture served by /architecture
+ARCHITECTURE = {
+    "name": "AlexNet",
+    "description": "AlexNet is a pioneering deep convolutional neural network that won the ImageNet Large Scale Visual Recognition Challenge in 2012. It consists of 5 convolutional layers, 3 max pooling layers, and 3 fully connected layers.",
+    "input_size": [3, 224, 224],
+    "num_classes": 1000,
+    "total_params": "61 million",
+    "layers": [
+        {"name": "Conv1", "type": "Conv2d", "params": "3→64, 11x11, stride=4, pad=2"},
+        {"name": "ReLU1", "type": "ReLU", "params": "inplace"},
+        {"name": "MaxPool1", "type": "MaxPool2d", "params": "3x3, stride=2"},
+        {"name": "Conv2", "type": "Conv2d", "params": "64→192, 5x5, stride=1, pad=2"},
+        {"name": "ReLU2", "type": "ReLU", "params": "inplace"},
+        {"name": "MaxPool2", "type": "MaxPool2d", "params": "3x3, stride=2"},
+        {"name": "Conv3", "type": "Conv2d", "params": "192→384, 3x3, stride=1, pad=1"},
+        {"name": "ReLU3", "type": "ReLU", "params": "inplace"},
+        {"name": "Conv4", "type": "Conv2d", "params": "384→256, 3x3, stride=1, pad=1"},
+        {"name": "ReLU4", "type": "ReLU", "params": "inplace"},
+        {"name": "Conv5", "type": "Conv2d", "params": "256→256, 3x3, stride=1, pad=1"},
+        {"name": "ReLU5", "type": "ReLU", "params": "inplace"},
+        {"name": "MaxPool3", "type": "MaxPool2d", "params": "3x3, stride=2"},
+        {"name": "AdaptiveAvgPool", "type": "AdaptiveAvgPool2d", "params": "6x6"},
+        {"name": "Flatten", "type": "Flatten", "params": "9216"},
+        {"name": "FC1", "type": "Linear", "params": "9216→4096"},
+        {"name": "ReLU6", "type": "ReLU", "params": "inplace"},
+        {"name": "Dropout1", "type": "Dropout", "params": "p=0.5"},
+        {"name": "FC2", "type": "Linear", "params": "4096→4096"},
+        {"name": "ReLU7", "type": "ReLU", "params": "inplace"},
+        {"name": "Dropout2", "type": "Dropout", "params": "p=0.5"},
+        {"name": "FC3", "type": "Linear", "params": "4096→1000"}
+    ],
+    "key_innovations": [
+        "Use of ReLU activation for faster training",
+        "Dropout for regularization",
+        "Data augmentation",
+        "GPU training with model parallelism",
+        "Local Response Normalization (original version)"
+    ]
+}
+
+
+# Micro-batching of concurrent prediction requests
+BATCH_MAX_SIZE = 16
+BATCH_WINDOW_SECONDS = 0.005
+
+_predict_queue: Optional[asyncio.Queue] = None
+
+
+async def _batch_worker(executor: ThreadPoolExecutor):
+    """Coalesce queued prediction requests into single forward passes."""
+    loop = asyncio.get_running_loop()
+    model = get_model()
+    
+    while True:
+        items = [await _predict_queue.get()]
+        
+        # Collect whatever else arrives within the batching window
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(items) < BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(_predict_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        tensors, layer_sets, futures = zip(*items)
+        # Only keep the activations some request in the batch asked for
+        layers = None if None in layer_sets else set().union(*layer_sets)
+        try:
+            results = await loop.run_in_executor(
+                executor, functools.partial(model.predict_batch, tensors, layers=layers)
+            )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+
+async def batched_predict(image: Union[Image.Image, torch.Tensor], layers: Optional[Set[str]] = None):
+    """
+    Queue an image, or an already preprocessed tensor, for the batch worker
+    and wait for its prediction.
+    
+    Args:
+        image: PIL Image or output of preprocess_image()
+        layers: Names of the activations the caller needs (None = all).
+            Other layers may still be present when batched with requests
+            that asked for more.
+    """
+    model = get_model()
+    future = asyncio.get_running_loop().create_future()
+    if isinstance(image, torch.Tensor):
+        input_tensor = image
+    else:
+        input_tensor = await asyncio.to_thread(model.preprocess_image, image)
+    await _predict_queue.put((input_tensor, layers, future))
+    return await future
+
+
+# FIFO cache of base64 previews, keyed by a hash of the raw upload
+PREVIEW_CACHE_SIZE = 128
+PREVIEW_MAX_SIZE = 400
+
+# Base64 prefixes of JPEG, PNG and WebP data, the formats every browser can
+# display, so small uploads in them are their own preview
+PASSTHROUGH_PREFIXES = ('/9j/', 'iVBOR', 'UklGR')
+
+_preview_cache: Dict[Tuple[bytes, str], str] = {}
+_preview_cache_lock = threading.Lock()
+
+
+def _image_key(source: Union[BinaryIO, str]) -> bytes:
+    """Hash an upload file or a base64 string into a cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    
+    if isinstance(source, str):
+        digest.update(source.encode())
+    else:
+        # Hash in chunks so the upload is never held in memory as a whole
+        for chunk in iter(lambda: source.read(1 << 16), b''):
+            digest.update(chunk)
+        source.seek(0)
+    
+    return digest.digest()
+
+
+def _open_rgb(source: Union[BinaryIO, str]) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Decode an uploaded file or a base64 string into an RGB image.
+    
+    JPEGs are decoded straight to RGB at the smallest DCT scale that still
+    covers the preview size, which is much cheaper than a full-resolution
+    decode for large photos.
+    
+    Returns:
+        Tuple of (RGB image, original (width, height) from the file header,
+        which the reduced-scale decode may exceed)
+    """
+    if isinstance(source, str):
+        image = base64_to_pil(source, load=False)
+    else:
+        image = Image.open(source)
+    original_size = image.size
+    
+    if image.format == 'JPEG':
+        image.draft('RGB', (PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+    image.load()
+    
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return image, original_size
+
+
+def _sync_decode(source: Union[BinaryIO, str], preview: bool = False,
+                 image_format: str = 'webp') -> Tuple[Image.Image, bytes, Optional[str]]:
+    """
+    Decode an uploaded file or a base64 string into an RGB image.
+    
+    Args:
+        source: Upload file object (read directly by the decoder), or a
+            base64-encoded image string
+        preview: Whether to also build the base64 preview of the image
+        image_format: Image format of the preview. Small JPEG, PNG and WebP
+            base64 uploads are returned as-is instead.
+        
+    Returns:
+        Tuple of (RGB image, cache key of the raw upload, base64 preview or None)
+    """
+    key = _image_key(source)
+    preview_key = (key, image_format)
+    original_b64 = _preview_cache.get(preview_key) if preview else None
+    
+    image, original_size = _open_rgb(source)
+    
+    # A small displayable base64 upload needs no resize or re-encode. The
+    # header size is checked, as a large JPEG is decoded at a reduced scale.
+    if preview and original_b64 is None and isinstance(source, str):
+        payload = source.split(',')[-1]
+        if max(original_size) <= PREVIEW_MAX_SIZE and payload.startswith(PASSTHROUGH_PREFIXES):
+            original_b64 = payload
+    
+    if preview and original_b64 is None:
+        preview_image = resize_image_for_preview(image, max_size=PREVIEW_MAX_SIZE)
+        original_b64 = pil_to_base64(preview_image, image_format)
+        
+        with _preview_cache_lock:
+            _preview_cache[preview_key] = original_b64
+            if len(_preview_cache) > PREVIEW_CACHE_SIZE:
+                del _preview_cache[next(iter(_preview_cache))]
+    
+    return image, key, original_b64
+
+
+async def _decode_and_preprocess(source: Union[BinaryIO, str], preview: bool = False,
+                                 image_format: str = 'webp') -> Tuple[Image.Image, bytes, Optional[str]]:
+    """Run _sync_decode in a worker thread to keep the event loop responsive."""
+    return await asyncio.to_thread(_sync_decode, source, preview, image_format)
+
+
+# Short-lived cache of conv5 activations from recent forward passes, so a
+# Grad-CAM request following /predict on the same image skips the conv layers
+ACTIVATION_CACHE_SIZE = 32
+ACTIVATION_CACHE_TTL = 60.0
+
+_activation_cache: "OrderedDict[bytes, Tuple[float, torch.Tensor]]" = OrderedDict()
+
+
+def _cache_conv5(key: bytes, activations: Dict[str, torch.Tensor]):
+    """Remember the conv5 activation of an image's forward pass."""
+    # Clone so the entry does not keep the whole batch's tensor alive
+    _activation_cache[key] = (time.monotonic(), activations['conv5'].clone())
+    _activation_cache.move_to_end(key)
+    while len(_activation_cache) > ACTIVATION_CACHE_SIZE:
+        _activation_cache.popitem(last=False)
+
+
+def _cached_conv5(key: bytes) -> Optional[torch.Tensor]:
+    """Return the cached conv5 activation for an image, if still fresh."""
+    entry = _activation_cache.get(key)
+    if entry is None:
+        return None
+    
+    timestamp, conv5 = entry
+    if time.monotonic() - timestamp > ACTIVATION_CACHE_TTL:
+        del _activation_cache[key]
+        return None
+    return conv5
+
+
+
+def _configure_torch_threads():
+    """Size PyTorch's thread pools; must run once, before any parallel work."""
+    # Inter-op threads can only be configured before any parallel work runs
+    torch.set_num_threads(TORCH_NUM_THREADS)
+    torch.set_num_interop_threads(1)
+    print(f"Torch threads: {TORCH_NUM_THREADS} per worker ({WEB_CONCURRENCY} workers)")
+
+
+def _init_model() -> AlexNetVisualizer:
+    """Create (or get) the model with the settings from the environment."""
+    print("Initializing AlexNet model...")
+    model = get_model(half=HALF_INFERENCE, quantize=QUANTIZE_INFERENCE,
+                      compile_model=COMPILE_INFERENCE, use_onnx=ONNX_INFERENCE)
+    print("Model initialized successfully!")
+    return model
+
+
+if EAGER_INIT:
+    _configure_torch_threads()
+    _init_model()
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Initialize model on startup for faster first request."""
-    print("Initializing AlexNet model...")
-    get_model()
-    print("Model initialized successfully!")
+    global _predict_queue
+    
+    if EAGER_INIT:
+        model = get_model()
+    else:
+        _configure_torch_threads()
+        model = _init_model()
+    
+    # Surface a plain Pillow / non-turbo libjpeg install early
+    libjpeg_turbo = pil_features.check_feature('libjpeg_turbo')
+    print(f"Pillow {PIL.__version__} (libjpeg-turbo: {bool(libjpeg_turbo)})")
+    if not libjpeg_turbo:
+        print("Warning: Pillow is not built with libjpeg-turbo, JPEG decoding will be slower")
+    
+    # Static responses are serialized once
+    app.state.architecture_json = orjson.dumps(ARCHITECTURE)
+    app.state.layers_json = orjson.dumps(
+        [layer.model_dump() for layer in _build_layer_infos(model)]
+    )
+    
+    # Pre-render the filter visualizations for every convolutional layer
+    app.state.filter_cache = {}
+    for layer_name in model.get_all_layer_names():
+        weights = model.get_filter_weights(layer_name)
+        if weights is not None:
+            app.state.filter_cache[layer_name] = {
+                "layer_name": layer_name,
+                "visualization": create_filter_visualization(weights, layer_name),
+                "num_filters": weights.shape[0],
+                "kernel_size": list(weights.shape[2:])
+            }
+    
+    # Batches run one at a time on a single thread, so it keeps the only input buffer
+    app.state.predict_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='predict')
+    _predict_queue = asyncio.Queue()
+    app.state.batch_worker = asyncio.create_task(_batch_worker(app.state.predict_executor))
+
+
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the prediction batch worker."""
+    app.state.batch_worker.cancel()
+    app.state.predict_executor.shutdown(wait=False)
 
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Check if the API is running."""
-    return {"status": "healthy", "model_loaded": True}
+    model = get_model()
+    return {
+        "status": "healthy",
+        "model_loaded": True,
+        # Reduced precision can shift low-margin top-1 predictions slightly vs fp32
+        "inference_precision": (
+            "int8 (fc layers)" if model.quantized
+            else str(model.inference_dtype).replace('torch.', '')
+        )
+    }
+
+
+def _build_layer_infos(model: AlexNetVisualizer) -> List[LayerInfo]:
+    """Collect the LayerInfo for every documented layer, in forward order."""
+    return [
+        LayerInfo(layer_name=layer_name, **info._asdict())
+        for layer_name, info in zip(model.LAYER_ORDER, model.LAYER_META_BY_INDEX)
+    ]
 
 
 # Get layer information
 @app.get("/layers", response_model=List[LayerInfo])
 async def get_layers():
     """Get information about all layers in AlexNet."""
-    model = get_model()
-    layer_names = model.get_all_layer_names()
-    
-    layers = []
-    for layer_name in layer_names:
-        info = model.get_layer_info(layer_name)
-        if info:
-            layers.append(LayerInfo(
-                name=info.get('name', layer_name),
-                layer_name=layer_name,
-                description=info.get('description', ''),
-                formula=info.get('formula'),
-                kernel_size=info.get('kernel_size'),
-                stride=info.get('stride'),
-                filters=info.get('filters'),
-                neurons=info.get('neurons')
-            ))
-    
-    return layers
+    return Response(app.state.layers_json, media_type="application/json")
 
 
 # Get specific layer information
@@ -133,24 +478,15 @@ async def get_layer_info(layer_name: str):
     model = get_model()
     info = model.get_layer_info(layer_name)
     
-    if not info:
+    if info is None:
         raise HTTPException(status_code=404, detail=f"Layer '{layer_name}' not found")
     
-    return LayerInfo(
-        name=info.get('name', layer_name),
-        layer_name=layer_name,
-        description=info.get('description', ''),
-        formula=info.get('formula'),
-        kernel_size=info.get('kernel_size'),
-        stride=info.get('stride'),
-        filters=info.get('filters'),
-        neurons=info.get('neurons')
-    )
+    return LayerInfo(layer_name=layer_name, **info._asdict())
 
 
 # Main prediction endpoint
 @app.post("/predict")
-async def predict(file: UploadFile = File(...)):
+async def predict(file: UploadFile = File(...), image_format: ImageFormat = 'webp'):
     """
     Classify an image and return predictions with intermediate activations.
     
@@ -160,38 +496,35 @@ async def predict(file: UploadFile = File(...)):
     - Probability chart
     """
     try:
-        # Read and validate image
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents))
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        # Decode straight from the spooled upload file
+        image, key, original_b64 = await _decode_and_preprocess(
+            file.file, preview=True, image_format=image_format
+        )
         
-        # Get model and run prediction
-        model = get_model()
-        best_class, top5_predictions, activations = model.predict(image)
+        # Run prediction (batched with concurrent requests)
+        best_class, top5_predictions, activations = await batched_predict(image)
+        _cache_conv5(key, activations)
         
         # Create visualizations
-        activation_visuals = create_all_activations_visualization(activations)
+        activation_visuals = create_all_activations_visualization(
+            activations, format=image_format
+        )
         prob_chart = create_probability_chart(top5_predictions)
         
-        # Create preview of original image
-        preview_image = resize_image_for_preview(image, max_size=400)
-        original_b64 = pil_to_base64(preview_image)
-        
         # Format probabilities
         prob_list = [
             {"class": name, "probability": round(prob * 100, 2)}
             for name, prob in top5_predictions
         ]
         
-        return {
+        # Returning the response directly skips jsonable_encoder on the large payload
+        return ORJSONResponse({
             "prediction": best_class,
             "probabilities": prob_list,
             "probability_chart": prob_chart,
             "activations": activation_visuals,
             "original_image": original_b64
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -199,47 +532,43 @@ async def predict(file: UploadFile = File(...)):
 
 # Predict from base64 image
 @app.post("/predict/base64")
-async def predict_base64(data: dict):
+async def predict_base64(data: B64ImageRequest):
     """
     Classify a base64-encoded image.
     
-    Accepts JSON with 'image' field containing base64-encoded image.
+    Accepts JSON with 'image' field containing base64-encoded image and an
+    optional 'image_format' ('webp', 'jpeg' or 'png') for the returned images.
     """
     try:
-        image_b64 = data.get('image')
-        if not image_b64:
-            raise HTTPException(status_code=400, detail="No image provided")
-        
-        image = base64_to_pil(image_b64)
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        image_format = data.image_format
+        image, key, original_b64 = await _decode_and_preprocess(
+            data.image, preview=True, image_format=image_format
+        )
         
-        # Get model and run prediction
-        model = get_model()
-        best_class, top5_predictions, activations = model.predict(image)
+        # Run prediction (batched with concurrent requests)
+        best_class, top5_predictions, activations = await batched_predict(image)
+        _cache_conv5(key, activations)
         
         # Create visualizations
-        activation_visuals = create_all_activations_visualization(activations)
+        activation_visuals = create_all_activations_visualization(
+            activations, format=image_format
+        )
         prob_chart = create_probability_chart(top5_predictions)
         
-        # Create preview of original image
-        preview_image = resize_image_for_preview(image, max_size=400)
-        original_b64 = pil_to_base64(preview_image)
-        
         # Format probabilities
         prob_list = [
             {"class": name, "probability": round(prob * 100, 2)}
             for name, prob in top5_predictions
         ]
         
-        return {
+        # Returning the response directly skips jsonable_encoder on the large payload
+        return ORJSONResponse({
             "prediction": best_class,
             "probabilities": prob_list,
             "probability_chart": prob_chart,
             "activations": activation_visuals,
             "original_image": original_b64
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -247,37 +576,38 @@ async def predict_base64(data: dict):
 
 # Get activation for a specific layer
 @app.post("/activations/{layer_name}")
-async def get_layer_activation(layer_name: str, file: UploadFile = File(...)):
+async def get_layer_activation(layer_name: str, file: UploadFile = File(...),
+                               image_format: ImageFormat = 'webp'):
     """Get activation visualization for a specific layer."""
     try:
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents))
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
         model = get_model()
-        _, _, activations = model.predict(image)
+        # Decoded like /predict and /gradcam, so the cached conv5 matches theirs
+        image, key, _ = await _decode_and_preprocess(file.file)
+        
+        # conv5 is kept for a follow-up Grad-CAM request on the same image
+        _, _, activations = await batched_predict(image, layers={layer_name, 'conv5'})
+        _cache_conv5(key, activations)
         
         if layer_name not in activations:
             raise HTTPException(status_code=404, detail=f"Layer '{layer_name}' not found")
         
         base64_img, metadata = create_activation_visualization(
-            activations, layer_name, max_maps=16
+            activations, layer_name, max_maps=16, format=image_format
         )
         
         # Also get individual feature maps
         individual_maps = create_individual_feature_maps(
-            activations[layer_name], max_maps=16
+            activations[layer_name], max_maps=16, format=image_format
         )
         
-        return {
+        layer_info = model.get_layer_info(layer_name)
+        return ORJSONResponse({
             "layer_name": layer_name,
             "grid_image": base64_img,
             "individual_maps": individual_maps,
             "metadata": metadata,
-            "layer_info": model.get_layer_info(layer_name)
-        }
+            "layer_info": layer_info.as_dict() if layer_info is not None else {}
+        })
         
     except HTTPException:
         raise
@@ -287,36 +617,31 @@ async def get_layer_activation(layer_name: str, file: UploadFile = File(...)):
 
 # Grad-CAM endpoint
 @app.post("/gradcam")
-async def compute_gradcam(file: UploadFile = File(...), target_class: int = None, alpha: float = 0.5):
+async def compute_gradcam(file: UploadFile = File(...), target_class: int = None, alpha: float = 0.5,
+                          image_format: ImageFormat = 'webp'):
     """
     Compute Grad-CAM visualization for an image.
     
     Returns the heatmap and overlay image showing where the model is focusing.
     """
     try:
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents))
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        image, key, _ = await _decode_and_preprocess(file.file)
         
         model = get_model()
         
-        # Compute Grad-CAM
-        heatmap, used_class = model.compute_gradcam(image, target_class)
+        # Compute Grad-CAM, reusing a recent forward pass of the same image
+        heatmap, used_class = model.compute_gradcam(
+            image, target_class, conv5=_cached_conv5(key)
+        )
         
         # Create overlay
         overlay_image = create_gradcam_overlay(image, heatmap, alpha)
         
         # Convert to base64
-        heatmap_uint8 = (heatmap * 255).astype(np.uint8)
-        import cv2
-        heatmap_colored = cv2.applyColorMap(heatmap_uint8, cv2.COLORMAP_JET)
-        heatmap_colored = cv2.cvtColor(heatmap_colored, cv2.COLOR_BGR2RGB)
+        heatmap_image = Image.fromarray(colorize_heatmap(heatmap), 'RGB')
         
-        from utils import numpy_to_base64
-        heatmap_b64 = numpy_to_base64(heatmap_colored)
-        overlay_b64 = pil_to_base64(overlay_image)
+        heatmap_b64 = pil_to_base64(heatmap_image, image_format)
+        overlay_b64 = pil_to_base64(overlay_image, image_format)
         
         return {
             "heatmap": heatmap_b64,
@@ -331,38 +656,30 @@ async def compute_gradcam(file: UploadFile = File(...), target_class: int = None
 
 # Grad-CAM from base64
 @app.post("/gradcam/base64")
-async def compute_gradcam_base64(data: dict):
+async def compute_gradcam_base64(data: GradCAMRequest):
     """Compute Grad-CAM from base64-encoded image."""
     try:
-        image_b64 = data.get('image')
-        target_class = data.get('target_class')
-        alpha = data.get('alpha', 0.5)
+        target_class = data.target_class
+        alpha = data.alpha
+        image_format = data.image_format
         
-        if not image_b64:
-            raise HTTPException(status_code=400, detail="No image provided")
-        
-        image = base64_to_pil(image_b64)
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        image, key, _ = await _decode_and_preprocess(data.image)
         
         model = get_model()
         
-        # Compute Grad-CAM
-        heatmap, used_class = model.compute_gradcam(image, target_class)
+        # Compute Grad-CAM, reusing a recent forward pass of the same image
+        heatmap, used_class = model.compute_gradcam(
+            image, target_class, conv5=_cached_conv5(key)
+        )
         
         # Create overlay
         overlay_image = create_gradcam_overlay(image, heatmap, alpha)
         
         # Convert to base64
-        heatmap_uint8 = (heatmap * 255).astype(np.uint8)
-        import cv2
-        heatmap_colored = cv2.applyColorMap(heatmap_uint8, cv2.COLORMAP_JET)
-        heatmap_colored = cv2.cvtColor(heatmap_colored, cv2.COLOR_BGR2RGB)
+        heatmap_image = Image.fromarray(colorize_heatmap(heatmap), 'RGB')
         
-        from utils import numpy_to_base64
-        heatmap_b64 = numpy_to_base64(heatmap_colored)
-        overlay_b64 = pil_to_base64(overlay_image)
+        heatmap_b64 = pil_to_base64(heatmap_image, image_format)
+        overlay_b64 = pil_to_base64(overlay_image, image_format)
         
         return {
             "heatmap": heatmap_b64,
@@ -379,73 +696,23 @@ async def compute_gradcam_base64(data: dict):
 @app.get("/filters/{layer_name}")
 async def get_filter_weights(layer_name: str):
     """Get visualization of learned filter weights for a convolutional layer."""
-    try:
-        model = get_model()
-        weights = model.get_filter_weights(layer_name)
-        
-        if weights is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Layer '{layer_name}' not found or not a convolutional layer"
-            )
-        
-        visualization = create_filter_visualization(weights, layer_name)
-        
-        return {
-            "layer_name": layer_name,
-            "visualization": visualization,
-            "num_filters": weights.shape[0],
-            "kernel_size": list(weights.shape[2:])
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Weights are fixed after load, so responses are rendered once at startup
+    response = app.state.filter_cache.get(layer_name)
+    
+    if response is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Layer '{layer_name}' not found or not a convolutional layer"
+        )
+    
+    return response
 
 
 # Get model architecture summary
 @app.get("/architecture")
 async def get_architecture():
     """Get a summary of the AlexNet architecture."""
-    return {
-        "name": "AlexNet",
-        "description": "AlexNet is a pioneering deep convolutional neural network that won the ImageNet Large Scale Visual Recognition Challenge in 2012. It consists of 5 convolutional layers, 3 max pooling layers, and 3 fully connected layers.",
-        "input_size": [3, 224, 224],
-        "num_classes": 1000,
-        "total_params": "61 million",
-        "layers": [
-            {"name": "Conv1", "type": "Conv2d", "params": "3→64, 11x11, stride=4, pad=2"},
-            {"name": "ReLU1", "type": "ReLU", "params": "inplace"},
-            {"name": "MaxPool1", "type": "MaxPool2d", "params": "3x3, stride=2"},
-            {"name": "Conv2", "type": "Conv2d", "params": "64→192, 5x5, stride=1, pad=2"},
-            {"name": "ReLU2", "type": "ReLU", "params": "inplace"},
-            {"name": "MaxPool2", "type": "MaxPool2d", "params": "3x3, stride=2"},
-            {"name": "Conv3", "type": "Conv2d", "params": "192→384, 3x3, stride=1, pad=1"},
-            {"name": "ReLU3", "type": "ReLU", "params": "inplace"},
-            {"name": "Conv4", "type": "Conv2d", "params": "384→256, 3x3, stride=1, pad=1"},
-            {"name": "ReLU4", "type": "ReLU", "params": "inplace"},
-            {"name": "Conv5", "type": "Conv2d", "params": "256→256, 3x3, stride=1, pad=1"},
-            {"name": "ReLU5", "type": "ReLU", "params": "inplace"},
-            {"name": "MaxPool3", "type": "MaxPool2d", "params": "3x3, stride=2"},
-            {"name": "AdaptiveAvgPool", "type": "AdaptiveAvgPool2d", "params": "6x6"},
-            {"name": "Flatten", "type": "Flatten", "params": "9216"},
-            {"name": "FC1", "type": "Linear", "params": "9216→4096"},
-            {"name": "ReLU6", "type": "ReLU", "params": "inplace"},
-            {"name": "Dropout1", "type": "Dropout", "params": "p=0.5"},
-            {"name": "FC2", "type": "Linear", "params": "4096→4096"},
-            {"name": "ReLU7", "type": "ReLU", "params": "inplace"},
-            {"name": "Dropout2", "type": "Dropout", "params": "p=0.5"},
-            {"name": "FC3", "type": "Linear", "params": "4096→1000"}
-        ],
-        "key_innovations": [
-            "Use of ReLU activation for faster training",
-            "Dropout for regularization",
-            "Data augmentation",
-            "GPU training with model parallelism",
-            "Local Response Normalization (original version)"
-        ]
-    }
+    return Response(app.state.architecture_json, media_type="application/json")
 
 
 # Run with: uvicorn main:app --reload --host 0.0.0.0 --port 8000
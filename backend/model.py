@@ -8,12 +8,130 @@ to capture intermediate layer activations for visualization.
 import torch
 import torch.nn as nn
 import torchvision.models as models
-from torchvision import transforms
+from torchvision.transforms import v2 as transforms
 from PIL import Image
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Collection, Dict, List, NamedTuple, Tuple, Optional, Sequence, Union
 import io
+import os
+import threading
+from contextlib import contextmanager
 import base64
+import inspect
+
+
+def _cpu_has_native_bf16() -> bool:
+    """Whether the CPU computes bfloat16 natively (AVX512-BF16 or AMX)."""
+    checks = ('_is_avx512_bf16_supported', '_is_amx_tile_supported')
+    return any(getattr(torch.cpu, check, lambda: False)() for check in checks)
+
+
+class LayerMeta(NamedTuple):
+    """Educational description of one AlexNet layer."""
+    name: str
+    description: str
+    formula: Optional[str] = None
+    kernel_size: Optional[str] = None
+    stride: Optional[int] = None
+    filters: Optional[int] = None
+    neurons: Optional[int] = None
+    
+    def as_dict(self) -> Dict:
+        """Return the fields that are set, for JSON responses."""
+        return {key: value for key, value in self._asdict().items() if value is not None}
+
+
+class ActivationCapture(nn.Module):
+    """
+    AlexNet forward pass that returns the intermediate activations as outputs.
+    
+    Python forward hooks cannot be compiled by TorchScript, so this module
+    records the same layers explicitly, which allows the whole graph to be
+    scripted, frozen and optimized for inference.
+    """
+    
+    def __init__(self, model: nn.Module, feature_layers: Dict[int, str],
+                 classifier_layers: Dict[int, str]):
+        super().__init__()
+        self.features = model.features
+        self.avgpool = model.avgpool
+        self.classifier = model.classifier
+        self.feature_layers = feature_layers
+        self.classifier_layers = classifier_layers
+        
+        # In-place ReLUs would overwrite the captured conv/fc outputs
+        for module in self.modules():
+            if isinstance(module, nn.ReLU):
+                module.inplace = False
+    
+    def forward(self, x: torch.Tensor) -> Dict[str, torch.Tensor]:
+        activations: Dict[str, torch.Tensor] = {}
+        
+        for idx, layer in enumerate(self.features):
+            x = layer(x)
+            if idx in self.feature_layers:
+                activations[self.feature_layers[idx]] = x
+        
+        x = self.avgpool(x)
+        activations['avgpool'] = x
+        x = torch.flatten(x, 1)
+        
+        for idx, layer in enumerate(self.classifier):
+            x = layer(x)
+            if idx in self.classifier_layers:
+                activations[self.classifier_layers[idx]] = x
+        
+        return activations
+
+
+class OnnxActivationCapture:
+    """
+    ActivationCapture exported to ONNX and run by ONNX Runtime.
+    
+    Every captured layer is a named graph output, so calling this returns the
+    same activations dict as the TorchScript module.
+    """
+    
+    def __init__(self, capture: ActivationCapture, device: str):
+        import onnxruntime as ort
+        
+        dummy = torch.zeros(1, 3, 224, 224, device=device)
+        with torch.inference_mode():
+            self.output_names = list(capture(dummy).keys())
+        
+        export_kwargs = {}
+        if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+            # The TorchScript-based exporter handles the dict output without onnxscript
+            export_kwargs['dynamo'] = False
+        
+        # Export in memory so concurrent workers never race on a shared file
+        buffer = io.BytesIO()
+        torch.onnx.export(
+            capture, dummy, buffer, opset_version=17,
+            input_names=['input'], output_names=self.output_names,
+            dynamic_axes={name: {0: 'batch'} for name in ['input', *self.output_names]},
+            **export_kwargs
+        )
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = torch.get_num_threads()
+        options.inter_op_num_threads = 1
+        providers = ['CPUExecutionProvider']
+        if device == 'cuda':
+            providers.insert(0, 'CUDAExecutionProvider')
+        self.session = ort.InferenceSession(
+            buffer.getvalue(), sess_options=options, providers=providers
+        )
+        self.device = device
+    
+    def __call__(self, x: torch.Tensor) -> Dict[str, torch.Tensor]:
+        outputs = self.session.run(
+            self.output_names, {'input': x.contiguous().cpu().numpy()}
+        )
+        return {
+            name: torch.from_numpy(output).to(self.device)
+            for name, output in zip(self.output_names, outputs)
+        }
 
 
 class AlexNetVisualizer:
@@ -24,213 +142,306 @@ class AlexNetVisualizer:
     
     # ImageNet class labels (top 1000)
     IMAGENET_LABELS_URL = "https://raw.githubusercontent.com/pytorch/hub/master/imagenet_classes.txt"
+    LABELS_CACHE_PATH = os.path.join(
+        os.path.expanduser('~'), '.cache', 'alexnet_viz', 'imagenet_classes.txt'
+    )
+    LABELS_DOWNLOAD_TIMEOUT = 5  # seconds
+    
+    # ImageNet normalization statistics
+    IMAGENET_MEAN = (0.485, 0.456, 0.406)
+    IMAGENET_STD = (0.229, 0.224, 0.225)
+    
+    # Map layer indices to names for the features (convolutional) part
+    # AlexNet features structure:
+    # 0: Conv2d(3, 64, 11, 4, 2)
+    # 1: ReLU
+    # 2: MaxPool2d(3, 2)
+    # 3: Conv2d(64, 192, 5, 1, 2)
+    # 4: ReLU
+    # 5: MaxPool2d(3, 2)
+    # 6: Conv2d(192, 384, 3, 1, 1)
+    # 7: ReLU
+    # 8: Conv2d(384, 256, 3, 1, 1)
+    # 9: ReLU
+    # 10: Conv2d(256, 256, 3, 1, 1)
+    # 11: ReLU
+    # 12: MaxPool2d(3, 2)
+    FEATURE_LAYERS = {
+        0: 'conv1',
+        1: 'relu1',
+        2: 'pool1',
+        3: 'conv2',
+        4: 'relu2',
+        5: 'pool2',
+        6: 'conv3',
+        7: 'relu3',
+        8: 'conv4',
+        9: 'relu4',
+        10: 'conv5',
+        11: 'relu5',
+        12: 'pool5'
+    }
+    
+    # Classifier structure:
+    # 0: Dropout
+    # 1: Linear(9216, 4096)
+    # 2: ReLU
+    # 3: Dropout
+    # 4: Linear(4096, 4096)
+    # 5: ReLU
+    # 6: Linear(4096, 1000)
+    CLASSIFIER_LAYERS = {
+        1: 'fc6',
+        2: 'relu6',
+        4: 'fc7',
+        5: 'relu7',
+        6: 'fc8'
+    }
     
     # Layer information for educational purposes
-    LAYER_INFO = {
-        'conv1': {
-            'name': 'Convolution Layer 1',
-            'kernel_size': '11x11',
-            'stride': 4,
-            'filters': 64,
-            'description': 'Extracts low-level features like edges, corners, and basic textures. Uses large 11x11 kernels to capture broad spatial patterns from the input image.',
-            'formula': 'y = Σ(x * w) + b where * is convolution'
-        },
-        'relu1': {
-            'name': 'ReLU Activation 1',
-            'description': 'Applies non-linear activation to introduce non-linearity into the model. Zeros out negative values while keeping positive values unchanged.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'pool1': {
-            'name': 'Max Pooling 1',
-            'kernel_size': '3x3',
-            'stride': 2,
-            'description': 'Reduces spatial dimensions while retaining the most important features. Takes the maximum value from each 3x3 region.',
-            'formula': 'y = max(x[i:i+k, j:j+k])'
-        },
-        'conv2': {
-            'name': 'Convolution Layer 2',
-            'kernel_size': '5x5',
-            'stride': 1,
-            'filters': 192,
-            'description': 'Builds upon low-level features to detect more complex patterns like textures and simple shapes.',
-            'formula': 'y = Σ(x * w) + b'
-        },
-        'relu2': {
-            'name': 'ReLU Activation 2',
-            'description': 'Non-linear activation that helps the network learn complex decision boundaries.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'pool2': {
-            'name': 'Max Pooling 2',
-            'kernel_size': '3x3',
-            'stride': 2,
-            'description': 'Further reduces spatial dimensions and provides translation invariance.',
-            'formula': 'y = max(x[i:i+k, j:j+k])'
-        },
-        'conv3': {
-            'name': 'Convolution Layer 3',
-            'kernel_size': '3x3',
-            'stride': 1,
-            'filters': 384,
-            'description': 'Detects higher-level features by combining patterns from previous layers.',
-            'formula': 'y = Σ(x * w) + b'
-        },
-        'relu3': {
-            'name': 'ReLU Activation 3',
-            'description': 'Continues to add non-linearity for learning complex patterns.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'conv4': {
-            'name': 'Convolution Layer 4',
-            'kernel_size': '3x3',
-            'stride': 1,
-            'filters': 256,
-            'description': 'Further refines feature representations, detecting object parts and complex textures.',
-            'formula': 'y = Σ(x * w) + b'
-        },
-        'relu4': {
-            'name': 'ReLU Activation 4',
-            'description': 'Non-linear activation for learning hierarchical feature representations.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'conv5': {
-            'name': 'Convolution Layer 5',
-            'kernel_size': '3x3',
-            'stride': 1,
-            'filters': 256,
-            'description': 'Extracts the highest-level visual features, often corresponding to semantic concepts and object parts.',
-            'formula': 'y = Σ(x * w) + b'
-        },
-        'relu5': {
-            'name': 'ReLU Activation 5',
-            'description': 'Final convolutional non-linearity before pooling.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'pool5': {
-            'name': 'Max Pooling 3',
-            'kernel_size': '3x3',
-            'stride': 2,
-            'description': 'Final spatial reduction before fully connected layers.',
-            'formula': 'y = max(x[i:i+k, j:j+k])'
-        },
-        'flatten': {
-            'name': 'Flatten',
-            'description': 'Converts 3D feature maps into a 1D vector for the fully connected layers.',
-            'formula': 'y = reshape(x, (batch_size, -1))'
-        },
-        'fc6': {
-            'name': 'Fully Connected Layer 1',
-            'neurons': 4096,
-            'description': 'First fully connected layer that combines all spatial features for high-level reasoning.',
-            'formula': 'y = Wx + b'
-        },
-        'relu6': {
-            'name': 'ReLU Activation 6',
-            'description': 'Non-linear activation in the fully connected layers.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'fc7': {
-            'name': 'Fully Connected Layer 2',
-            'neurons': 4096,
-            'description': 'Second fully connected layer for further feature abstraction.',
-            'formula': 'y = Wx + b'
-        },
-        'relu7': {
-            'name': 'ReLU Activation 7',
-            'description': 'Non-linear activation before the final classification layer.',
-            'formula': 'f(x) = max(0, x)'
-        },
-        'fc8': {
-            'name': 'Output Layer',
-            'neurons': 1000,
-            'description': 'Final classification layer that outputs raw scores (logits) for each of the 1000 ImageNet classes.',
-            'formula': 'y = Wx + b'
-        },
-        'softmax': {
-            'name': 'Softmax',
-            'description': 'Converts raw logits into probability distribution. Each output represents the probability of the input belonging to that class.',
-            'formula': 'P(class_i) = e^(z_i) / Σ(e^(z_j))'
-        }
+    LAYER_INFO: Dict[str, LayerMeta] = {
+        'conv1': LayerMeta(
+            name='Convolution Layer 1',
+            kernel_size='11x11',
+            stride=4,
+            filters=64,
+            description='Extracts low-level features like edges, corners, and basic textures. Uses large 11x11 kernels to capture broad spatial patterns from the input image.',
+            formula='y = Σ(x * w) + b where * is convolution'
+        ),
+        'relu1': LayerMeta(
+            name='ReLU Activation 1',
+            description='Applies non-linear activation to introduce non-linearity into the model. Zeros out negative values while keeping positive values unchanged.',
+            formula='f(x) = max(0, x)'
+        ),
+        'pool1': LayerMeta(
+            name='Max Pooling 1',
+            kernel_size='3x3',
+            stride=2,
+            description='Reduces spatial dimensions while retaining the most important features. Takes the maximum value from each 3x3 region.',
+            formula='y = max(x[i:i+k, j:j+k])'
+        ),
+        'conv2': LayerMeta(
+            name='Convolution Layer 2',
+            kernel_size='5x5',
+            stride=1,
+            filters=192,
+            description='Builds upon low-level features to detect more complex patterns like textures and simple shapes.',
+            formula='y = Σ(x * w) + b'
+        ),
+        'relu2': LayerMeta(
+            name='ReLU Activation 2',
+            description='Non-linear activation that helps the network learn complex decision boundaries.',
+            formula='f(x) = max(0, x)'
+        ),
+        'pool2': LayerMeta(
+            name='Max Pooling 2',
+            kernel_size='3x3',
+            stride=2,
+            description='Further reduces spatial dimensions and provides translation invariance.',
+            formula='y = max(x[i:i+k, j:j+k])'
+        ),
+        'conv3': LayerMeta(
+            name='Convolution Layer 3',
+            kernel_size='3x3',
+            stride=1,
+            filters=384,
+            description='Detects higher-level features by combining patterns from previous layers.',
+            formula='y = Σ(x * w) + b'
+        ),
+        'relu3': LayerMeta(
+            name='ReLU Activation 3',
+            description='Continues to add non-linearity for learning complex patterns.',
+            formula='f(x) = max(0, x)'
+        ),
+        'conv4': LayerMeta(
+            name='Convolution Layer 4',
+            kernel_size='3x3',
+            stride=1,
+            filters=256,
+            description='Further refines feature representations, detecting object parts and complex textures.',
+            formula='y = Σ(x * w) + b'
+        ),
+        'relu4': LayerMeta(
+            name='ReLU Activation 4',
+            description='Non-linear activation for learning hierarchical feature representations.',
+            formula='f(x) = max(0, x)'
+        ),
+        'conv5': LayerMeta(
+            name='Convolution Layer 5',
+            kernel_size='3x3',
+            stride=1,
+            filters=256,
+            description='Extracts the highest-level visual features, often corresponding to semantic concepts and object parts.',
+            formula='y = Σ(x * w) + b'
+        ),
+        'relu5': LayerMeta(
+            name='ReLU Activation 5',
+            description='Final convolutional non-linearity before pooling.',
+            formula='f(x) = max(0, x)'
+        ),
+        'pool5': LayerMeta(
+            name='Max Pooling 3',
+            kernel_size='3x3',
+            stride=2,
+            description='Final spatial reduction before fully connected layers.',
+            formula='y = max(x[i:i+k, j:j+k])'
+        ),
+        'flatten': LayerMeta(
+            name='Flatten',
+            description='Converts 3D feature maps into a 1D vector for the fully connected layers.',
+            formula='y = reshape(x, (batch_size, -1))'
+        ),
+        'fc6': LayerMeta(
+            name='Fully Connected Layer 1',
+            neurons=4096,
+            description='First fully connected layer that combines all spatial features for high-level reasoning.',
+            formula='y = Wx + b'
+        ),
+        'relu6': LayerMeta(
+            name='ReLU Activation 6',
+            description='Non-linear activation in the fully connected layers.',
+            formula='f(x) = max(0, x)'
+        ),
+        'fc7': LayerMeta(
+            name='Fully Connected Layer 2',
+            neurons=4096,
+            description='Second fully connected layer for further feature abstraction.',
+            formula='y = Wx + b'
+        ),
+        'relu7': LayerMeta(
+            name='ReLU Activation 7',
+            description='Non-linear activation before the final classification layer.',
+            formula='f(x) = max(0, x)'
+        ),
+        'fc8': LayerMeta(
+            name='Output Layer',
+            neurons=1000,
+            description='Final classification layer that outputs raw scores (logits) for each of the 1000 ImageNet classes.',
+            formula='y = Wx + b'
+        ),
+        'softmax': LayerMeta(
+            name='Softmax',
+            description='Converts raw logits into probability distribution. Each output represents the probability of the input belonging to that class.',
+            formula='P(class_i) = e^(z_i) / Σ(e^(z_j))'
+        )
     }
     
-    def __init__(self, device: str = None):
-        """Initialize the AlexNet model with hooks for capturing activations."""
+    # Capturable layer names in forward order, and their metadata by position
+    LAYER_ORDER: Tuple[str, ...] = (
+        'conv1', 'relu1', 'pool1',
+        'conv2', 'relu2', 'pool2',
+        'conv3', 'relu3',
+        'conv4', 'relu4',
+        'conv5', 'relu5', 'pool5',
+        'fc6', 'relu6',
+        'fc7', 'relu7',
+        'fc8', 'softmax'
+    )
+    LAYER_META_BY_INDEX: Tuple[LayerMeta, ...] = tuple(map(LAYER_INFO.__getitem__, LAYER_ORDER))
+    
+    def __init__(self, device: str = None, optimize: bool = True, half: bool = True,
+                 quantize: bool = True, compile_model: bool = False, use_onnx: bool = False,
+                 cuda_graphs: bool = True):
+        """
+        Initialize the AlexNet model with hooks for capturing activations.
+        
+        Args:
+            device: Device to run on, defaults to CUDA when available
+            optimize: Build and warm up the optimized prediction model now,
+                see optimize_for_inference()
+            half: Passed to optimize_for_inference()
+            quantize: Passed to optimize_for_inference()
+            compile_model: Passed to optimize_for_inference()
+            use_onnx: Passed to optimize_for_inference()
+            cuda_graphs: Passed to optimize_for_inference()
+        """
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         print(f"Using device: {self.device}")
         
         # Load pretrained AlexNet
         self.model = models.alexnet(weights=models.AlexNet_Weights.IMAGENET1K_V1)
-        self.model = self.model.to(self.device)
+        self.model = self.model.to(self.device, memory_format=torch.channels_last)
         self.model.eval()
         
-        # Storage for intermediate activations
-        self.activations: Dict[str, torch.Tensor] = {}
-        self.gradients: Dict[str, torch.Tensor] = {}
+        # Per-thread state: the preallocated input batch (see _input_buffer())
+        # and the dict the activation hooks record into (see _capturing())
+        self._local = threading.local()
+        
+        # Optimized forward-only model, see optimize_for_inference()
+        self.inference_model: Optional[Union[nn.Module, OnnxActivationCapture]] = None
+        self.inference_dtype = torch.float32
+        self.quantized = False
+        
+        # Captured single-image CUDA graph of the optimized model, see
+        # _capture_cuda_graph(). Replays share static buffers, hence the lock.
+        self._cuda_graph: Optional[torch.cuda.CUDAGraph] = None
+        self._graph_input: Optional[torch.Tensor] = None
+        self._graph_outputs: Dict[str, torch.Tensor] = {}
+        self._graph_lock = threading.Lock()
         
         # Register hooks
         self._register_hooks()
         
+        # Weights never change after loading, so filters are copied out once
+        self._filter_cache = self._build_filter_cache()
+        
         # Load ImageNet labels
         self.labels = self._load_imagenet_labels()
         
-        # Image preprocessing transform
+        # Image preprocessing transform, resizing the uint8 tensor rather than the
+        # PIL image. Normalization happens on the device, see _normalize().
         self.transform = transforms.Compose([
-            transforms.Resize(256),
-            transforms.CenterCrop(224),
-            transforms.ToTensor(),
-            transforms.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225]
-            )
+            transforms.PILToTensor(),
+            transforms.Resize(256, antialias=True),
+            transforms.CenterCrop(224)
         ])
+        
+        # Normalization statistics, created once on the device
+        self._mean = torch.tensor(self.IMAGENET_MEAN, device=self.device).view(1, 3, 1, 1)
+        self._std = torch.tensor(self.IMAGENET_STD, device=self.device).view(1, 3, 1, 1)
+        
+        if optimize:
+            self.optimize_for_inference(half=half, quantize=quantize,
+                                        compile_model=compile_model, use_onnx=use_onnx,
+                                        cuda_graphs=cuda_graphs)
+    
+    @staticmethod
+    def _parse_labels(text: str) -> Tuple[str, ...]:
+        """Split a newline-separated label file, dropping blank lines."""
+        return tuple(filter(None, map(str.strip, text.split('\n'))))
     
-    def _load_imagenet_labels(self) -> List[str]:
-        """Load ImageNet class labels."""
+    def _load_imagenet_labels(self) -> Tuple[str, ...]:
+        """Load ImageNet class labels, downloading them only on a cache miss."""
+        try:
+            with open(self.LABELS_CACHE_PATH, encoding='utf-8') as f:
+                labels = self._parse_labels(f.read())
+            if len(labels) == 1000:
+                return labels
+        except OSError:
+            pass
+        
         try:
             import urllib.request
-            response = urllib.request.urlopen(self.IMAGENET_LABELS_URL)
-            labels = [line.decode('utf-8').strip() for line in response.readlines()]
-            return labels
+            with urllib.request.urlopen(self.IMAGENET_LABELS_URL,
+                                        timeout=self.LABELS_DOWNLOAD_TIMEOUT) as response:
+                labels = self._parse_labels(response.read().decode('utf-8'))
         except Exception as e:
             print(f"Could not load ImageNet labels: {e}")
-            return [f"class_{i}" for i in range(1000)]
+            return tuple(f"class_{i}" for i in range(1000))
+        
+        try:
+            os.makedirs(os.path.dirname(self.LABELS_CACHE_PATH), exist_ok=True)
+            with open(self.LABELS_CACHE_PATH, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(labels) + '\n')
+        except OSError as e:
+            print(f"Could not cache ImageNet labels: {e}")
+        
+        return labels
     
     def _register_hooks(self):
         """Register forward hooks to capture intermediate activations."""
-        # Map layer indices to names for the features (convolutional) part
-        # AlexNet features structure:
-        # 0: Conv2d(3, 64, 11, 4, 2)
-        # 1: ReLU
-        # 2: MaxPool2d(3, 2)
-        # 3: Conv2d(64, 192, 5, 1, 2)
-        # 4: ReLU
-        # 5: MaxPool2d(3, 2)
-        # 6: Conv2d(192, 384, 3, 1, 1)
-        # 7: ReLU
-        # 8: Conv2d(384, 256, 3, 1, 1)
-        # 9: ReLU
-        # 10: Conv2d(256, 256, 3, 1, 1)
-        # 11: ReLU
-        # 12: MaxPool2d(3, 2)
-        
-        feature_layers = {
-            0: 'conv1',
-            1: 'relu1',
-            2: 'pool1',
-            3: 'conv2',
-            4: 'relu2',
-            5: 'pool2',
-            6: 'conv3',
-            7: 'relu3',
-            8: 'conv4',
-            9: 'relu4',
-            10: 'conv5',
-            11: 'relu5',
-            12: 'pool5'
-        }
-        
         # Register hooks for feature layers
-        for idx, name in feature_layers.items():
+        for idx, name in self.FEATURE_LAYERS.items():
             self.model.features[idx].register_forward_hook(
                 self._get_activation_hook(name)
             )
@@ -240,188 +451,387 @@ class AlexNetVisualizer:
             self._get_activation_hook('avgpool')
         )
         
-        # Classifier structure:
-        # 0: Dropout
-        # 1: Linear(9216, 4096)
-        # 2: ReLU
-        # 3: Dropout
-        # 4: Linear(4096, 4096)
-        # 5: ReLU
-        # 6: Linear(4096, 1000)
-        
-        classifier_layers = {
-            1: 'fc6',
-            2: 'relu6',
-            4: 'fc7',
-            5: 'relu7',
-            6: 'fc8'
-        }
-        
-        for idx, name in classifier_layers.items():
+        for idx, name in self.CLASSIFIER_LAYERS.items():
             self.model.classifier[idx].register_forward_hook(
                 self._get_activation_hook(name)
             )
     
+    def optimize_for_inference(self, half: bool = True, quantize: bool = True,
+                               compile_model: bool = False, use_onnx: bool = False,
+                               cuda_graphs: bool = True):
+        """
+        Build an optimized copy of the model for the prediction path.
+        
+        The eager model keeps its hooks, full precision and autograd support
+        for Grad-CAM; predict() switches to the optimized copy once it exists.
+        
+        Args:
+            half: Run in float16 on CUDA, or bfloat16 on CPUs that support it
+                natively. Takes precedence over quantize.
+            quantize: Use dynamic int8 fully connected layers when on CPU
+            compile_model: Compile with torch.compile (PyTorch 2.x) instead of
+                TorchScript. Takes precedence over quantize, since Inductor
+                cannot compile the quantized linear ops.
+            use_onnx: Run the prediction path with ONNX Runtime (in float32)
+                when onnxruntime is installed. Takes precedence over the
+                other options.
+            cuda_graphs: On CUDA, capture the single-image forward pass of the
+                TorchScript copy in a CUDA graph, replaying all kernel launches
+                at once. (torch.compile's reduce-overhead mode uses CUDA graphs
+                by itself.)
+        """
+        if use_onnx:
+            # Imported only when asked for: ONNX Runtime is an optional dependency
+            try:
+                import onnxruntime  # noqa: F401
+            except ImportError:
+                print("onnxruntime is not installed, using TorchScript instead")
+                use_onnx = False
+        
+        # Optimize a hook-free copy: neither compiler can handle the Python hooks
+        model = models.alexnet()
+        model.load_state_dict(self.model.state_dict())
+        capture = ActivationCapture(
+            model, self.FEATURE_LAYERS, self.CLASSIFIER_LAYERS
+        ).to(self.device, memory_format=torch.channels_last).eval()
+        
+        # Casting the copy halves weight and activation traffic. Emulated bf16
+        # is slower than fp32, so CPUs without native support stay in fp32.
+        # (Per-op autocast was measured slower than a cast copy.)
+        self.inference_dtype = torch.float32
+        if half and not use_onnx and self.device == 'cuda':
+            self.inference_dtype = torch.float16
+        elif half and not use_onnx and self.device == 'cpu' and _cpu_has_native_bf16():
+            self.inference_dtype = torch.bfloat16
+        capture = capture.to(self.inference_dtype)
+        
+        self.quantized = False
+        if use_onnx:
+            optimized = OnnxActivationCapture(capture, self.device)
+        elif compile_model and hasattr(torch, 'compile'):
+            optimized = torch.compile(capture, mode='reduce-overhead', fullgraph=True)
+        else:
+            # Dynamic quantization only has CPU kernels, and only for Linear layers,
+            # which hold ~94% of AlexNet's weights (fc6-fc8)
+            self.quantized = (quantize and self.device == 'cpu'
+                              and self.inference_dtype == torch.float32)
+            if self.quantized:
+                capture = torch.ao.quantization.quantize_dynamic(
+                    capture, {nn.Linear}, dtype=torch.qint8
+                )
+            
+            scripted = torch.jit.freeze(torch.jit.script(capture))
+            optimized = torch.jit.optimize_for_inference(scripted)
+        
+        # Compile and profile now rather than on the first requests
+        dummy = torch.zeros(1, 3, 224, 224, device=self.device, dtype=self.inference_dtype)
+        dummy = dummy.contiguous(memory_format=torch.channels_last)
+        with torch.inference_mode():
+            for _ in range(2):
+                optimized(dummy)
+        self.inference_model = optimized
+        
+        self._cuda_graph = None
+        if cuda_graphs and self.device == 'cuda' and not (use_onnx or compile_model):
+            self._capture_cuda_graph(optimized)
+    
+    def _capture_cuda_graph(self, model: nn.Module):
+        """Capture the forward pass of a single image into a CUDA graph."""
+        static_input = torch.zeros(1, 3, 224, 224, device=self.device, dtype=self.inference_dtype)
+        static_input = static_input.contiguous(memory_format=torch.channels_last)
+        
+        # Warm up on a side stream, as graph capture requires
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream), torch.inference_mode():
+            for _ in range(3):
+                model(static_input)
+        torch.cuda.current_stream().wait_stream(stream)
+        
+        graph = torch.cuda.CUDAGraph()
+        with torch.inference_mode(), torch.cuda.graph(graph):
+            static_outputs = model(static_input)
+        
+        self._graph_input = static_input
+        self._graph_outputs = static_outputs
+        self._cuda_graph = graph
+    
+    def _run_inference_model(self, input_tensor: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """Run the optimized model, replaying the CUDA graph for single images."""
+        if self._cuda_graph is None or input_tensor.shape[0] != 1:
+            return self.inference_model(input_tensor)
+        
+        with self._graph_lock:
+            self._graph_input.copy_(input_tensor)
+            self._cuda_graph.replay()
+            # The next replay overwrites the static outputs
+            return {name: output.clone() for name, output in self._graph_outputs.items()}
+    
     def _get_activation_hook(self, name: str):
         """Create a hook function that saves the activation."""
         def hook(module, input, output):
-            self.activations[name] = output.detach()
+            activations = getattr(self._local, 'activations', None)
+            if activations is not None:
+                # Under inference mode there is no graph to detach from
+                activations[name] = output.detach() if output.requires_grad else output
         return hook
     
-    def _get_gradient_hook(self, name: str):
-        """Create a hook function that saves the gradients."""
-        def hook(module, grad_input, grad_output):
-            self.gradients[name] = grad_output[0].detach()
-        return hook
+    @contextmanager
+    def _capturing(self, activations: Dict[str, torch.Tensor]):
+        """
+        Record the calling thread's activations into the given dict.
+        
+        Outside this context the hooks record nothing, so no captured tensors
+        outlive the call that asked for them, and concurrent calls on other
+        threads never see each other's activations.
+        """
+        self._local.activations = activations
+        try:
+            yield activations
+        finally:
+            self._local.activations = None
     
+    @torch.inference_mode()
     def preprocess_image(self, image: Image.Image) -> torch.Tensor:
         """Preprocess an image for the model."""
         if image.mode != 'RGB':
             image = image.convert('RGB')
-        tensor = self.transform(image)
-        return tensor.unsqueeze(0).to(self.device)
+        image = self.transform(image)
+        if self.device == 'cuda':
+            # Page-locked memory lets the host-to-device copy run asynchronously
+            image = image.pin_memory()
+        return self._normalize(image)
+    
+    def _normalize(self, image: torch.Tensor) -> torch.Tensor:
+        """Move a cropped (3, 224, 224) uint8 image to the device and normalize it there."""
+        # Transferring uint8 moves a quarter of the bytes of the float tensor
+        tensor = image.to(self.device, non_blocking=True).unsqueeze(0).float()
+        tensor = tensor.div_(255.0).sub_(self._mean).div_(self._std)
+        # NHWC lets the CPU backend pick its faster convolution kernels
+        return tensor.contiguous(memory_format=torch.channels_last)
     
-    def predict(self, image: Image.Image) -> Tuple[str, List[Tuple[str, float]], Dict[str, torch.Tensor]]:
+    def _input_buffer(self, batch_size: int) -> torch.Tensor:
+        """Return this thread's preallocated channels-last input batch, grown on demand."""
+        buffer = getattr(self._local, 'input_buffer', None)
+        if (buffer is None or buffer.shape[0] < batch_size
+                or buffer.dtype != self.inference_dtype):
+            buffer = torch.empty(batch_size, 3, 224, 224, device=self.device,
+                                 dtype=self.inference_dtype,
+                                 memory_format=torch.channels_last)
+            self._local.input_buffer = buffer
+        return buffer[:batch_size]
+    
+    def predict(self, image: Image.Image, capture: bool = True,
+                layers: Optional[Collection[str]] = None) -> Tuple[str, List[Tuple[str, float]], Dict[str, torch.Tensor]]:
         """
         Run inference on an image and return predictions with activations.
         
         Args:
             image: PIL Image to classify
+            capture: Whether to return the intermediate activations
+            layers: Names of the activations to return (None = all)
             
         Returns:
-            Tuple of (predicted_class, top5_probabilities, activations_dict)
+            Tuple of (predicted_class, top5_probabilities, activations_dict).
+            The activations dict is empty when capture is False.
         """
-        # Clear previous activations
-        self.activations.clear()
-        
-        # Preprocess and predict
-        input_tensor = self.preprocess_image(image)
+        return self.predict_batch([image], capture=capture, layers=layers)[0]
+    
+    def predict_batch(self, inputs: Union[torch.Tensor, Sequence[Union[Image.Image, torch.Tensor]]],
+                      capture: bool = True,
+                      layers: Optional[Collection[str]] = None) -> List[Tuple[str, List[Tuple[str, float]], Dict[str, torch.Tensor]]]:
+        """
+        Run a single forward pass over a batch of preprocessed images.
         
-        with torch.no_grad():
-            output = self.model(input_tensor)
+        Args:
+            inputs: Preprocessed batch of shape (B, 3, 224, 224), or a sequence
+                of PIL Images and/or (1, 3, 224, 224) tensors from
+                preprocess_image. A sequence is copied into this thread's
+                persistent input buffer instead of being concatenated into a
+                fresh tensor.
+            capture: Whether to return the intermediate activations. Without
+                them the hooks record nothing and no per-layer tensors are
+                converted or sliced.
+            layers: Names of the activations to return (None = all). Only
+                these are converted and copied off the device.
+            
+        Returns:
+            One (predicted_class, top5_probabilities, activations_dict) tuple
+            per image. Activations are CPU tensors with a batch dimension of
+            1, and are empty when capture is False.
+        """
+        if not isinstance(inputs, torch.Tensor):
+            inputs = [
+                self.preprocess_image(item) if isinstance(item, Image.Image) else item
+                for item in inputs
+            ]
+        
+        # Grad mode is thread-local, so this must run on the calling thread
+        with torch.inference_mode():
+            if isinstance(inputs, torch.Tensor):
+                input_tensor = inputs.to(self.inference_dtype, memory_format=torch.channels_last)
+            else:
+                input_tensor = self._input_buffer(len(inputs))
+                torch.cat(inputs, out=input_tensor)
+            
+            if self.inference_model is not None:
+                activations = self._run_inference_model(input_tensor)
+                logits = activations['fc8']
+            else:
+                if capture:
+                    with self._capturing({}) as activations:
+                        logits = self.model(input_tensor)
+                else:
+                    logits = self.model(input_tensor)
+        
+        if not capture:
+            activations = {}
+        elif layers is not None:
+            activations = {name: activations[name] for name in layers if name in activations}
+        
+        if self.inference_dtype != torch.float32:
+            # Softmax and the NumPy-based visualizations work in float32
+            logits = logits.float()
+            activations = {name: act.float() for name, act in activations.items()}
+        
+        if self.device != 'cpu':
+            # The visualizations run on the host anyway; copying now frees the
+            # device memory instead of holding it while the response renders
+            activations = {name: act.cpu() for name, act in activations.items()}
         
         # Apply softmax to get probabilities
-        probabilities = torch.nn.functional.softmax(output[0], dim=0)
-        
-        # Get top 5 predictions
-        top5_prob, top5_idx = torch.topk(probabilities, 5)
-        top5_predictions = [
-            (self.labels[idx.item()], prob.item())
-            for idx, prob in zip(top5_idx, top5_prob)
-        ]
-        
-        # Best prediction
-        best_class = self.labels[top5_idx[0].item()]
+        probabilities = torch.nn.functional.softmax(logits, dim=1)
+        
+        # Get top 5 predictions for every image, read back in one transfer each
+        top5_prob, top5_idx = torch.topk(probabilities, 5, dim=1)
+        top5_prob, top5_idx = top5_prob.tolist(), top5_idx.tolist()
+        
+        results = []
+        for i in range(input_tensor.shape[0]):
+            top5_predictions = [
+                (self.labels[idx], prob)
+                for idx, prob in zip(top5_idx[i], top5_prob[i])
+            ]
+            
+            # Best prediction
+            best_class = top5_predictions[0][0]
+            
+            image_activations = {
+                name: activation[i:i + 1]
+                for name, activation in activations.items()
+            }
+            results.append((best_class, top5_predictions, image_activations))
         
-        return best_class, top5_predictions, dict(self.activations)
+        return results
     
-    def compute_gradcam(self, image: Image.Image, target_class: int = None) -> np.ndarray:
+    def _forward_from_conv5(self, conv5: torch.Tensor) -> torch.Tensor:
+        """Run the layers after conv5 on a conv5 output and return the logits."""
+        x = torch.relu(conv5)  # relu5 (out of place, conv5 may be a leaf)
+        x = self.model.features[12](x)  # pool5
+        x = self.model.avgpool(x)
+        x = torch.flatten(x, 1)
+        return self.model.classifier(x)
+    
+    def compute_gradcam(self, image: Image.Image, target_class: int = None,
+                        conv5: Optional[torch.Tensor] = None) -> np.ndarray:
         """
         Compute Grad-CAM heatmap for the given image.
         
         Args:
             image: PIL Image to analyze
             target_class: Class index for Grad-CAM (None = use predicted class)
+            conv5: conv5 activation from an earlier forward pass on the same
+                image. When given, only the layers after conv5 are re-run.
             
         Returns:
             Heatmap as numpy array (H, W) with values in [0, 1]
         """
-        self.activations.clear()
-        self.gradients.clear()
-        
-        # Enable gradients for Grad-CAM
-        input_tensor = self.preprocess_image(image)
-        input_tensor.requires_grad = True
-        
-        # Register backward hook for gradients
-        target_layer = self.model.features[10]  # conv5
-        
-        gradients = []
-        def save_gradient(module, grad_input, grad_output):
-            gradients.append(grad_output[0].detach())
-        
-        handle = target_layer.register_backward_hook(save_gradient)
-        
-        # Forward pass
-        output = self.model(input_tensor)
-        
-        # Get target class
+        if conv5 is None:
+            # Gradients are only needed from conv5 onwards
+            input_tensor = self.preprocess_image(image)
+            with torch.inference_mode():
+                conv5 = self.model.features[:11](input_tensor)
+        else:
+            # Activations returned by predict() live on the host
+            conv5 = conv5.to(self.device, non_blocking=True)
+        
+        # Differentiate the class score w.r.t. the conv5 output
+        activation = conv5.clone().requires_grad_(True)
+        output = self._forward_from_conv5(activation)
+        
+        # Select the class score on the device; the predicted class index is
+        # only read back once the gradient has been queued
         if target_class is None:
-            target_class = output.argmax(dim=1).item()
+            score, predicted = output[0].max(dim=0)
+        else:
+            score, predicted = output[0, target_class], None
         
-        # Backward pass
-        self.model.zero_grad()
-        output[0, target_class].backward()
+        gradient, = torch.autograd.grad(score, activation)
+        if predicted is not None:
+            target_class = predicted.item()
         
-        # Get gradients and activations
-        gradient = gradients[0]
-        activation = self.activations['conv5']
+        # Grad-CAM weighs the rectified conv5 maps
+        activation = torch.relu(activation.detach())
         
         # Compute Grad-CAM
         weights = gradient.mean(dim=(2, 3), keepdim=True)  # Global average pooling
         cam = (weights * activation).sum(dim=1, keepdim=True)
         cam = torch.relu(cam)  # ReLU on the CAM    
         
-        # Normalize to [0, 1]
-        cam = cam - cam.min()
-        if cam.max() > 0:
-            cam = cam / cam.max()
-        
         # Resize to input size
         cam = torch.nn.functional.interpolate(
             cam, size=(224, 224), mode='bilinear', align_corners=False
         )
         
+        # Normalize to [0, 1] on the device, without syncing on a host-side check
+        cam_min, cam_max = cam.amin(), cam.amax()
+        cam = torch.where(cam_max > cam_min, (cam - cam_min) / (cam_max - cam_min),
+                          torch.zeros_like(cam))
+        
         # Convert to numpy
         cam = cam.squeeze().cpu().numpy()
         
-        # Remove hook
-        handle.remove()
-        
         return cam, target_class
     
-    def get_filter_weights(self, layer_name: str = 'conv1') -> np.ndarray:
-        """Get the learned filter weights from a convolutional layer."""
-        layer_map = {
-            'conv1': 0,
-            'conv2': 3,
-            'conv3': 6,
-            'conv4': 8,
-            'conv5': 10
-        }
-        
-        if layer_name not in layer_map:
-            return None
-        
-        layer = self.model.features[layer_map[layer_name]]
-        weights = layer.weight.detach().cpu().numpy()
-        return weights
+    def _build_filter_cache(self) -> Dict[str, np.ndarray]:
+        """Copy every convolutional layer's weights to the host once."""
+        cache = {}
+        for idx, name in self.FEATURE_LAYERS.items():
+            if name.startswith('conv'):
+                weights = self.model.features[idx].weight.detach().cpu().numpy()
+                weights.setflags(write=False)  # Shared by every caller
+                cache[name] = weights
+        return cache
+    
+    def get_filter_weights(self, layer_name: str = 'conv1') -> Optional[np.ndarray]:
+        """Get the learned filter weights (read-only) from a convolutional layer."""
+        return self._filter_cache.get(layer_name)
     
-    def get_layer_info(self, layer_name: str) -> Dict:
+    def get_layer_info(self, layer_name: str) -> Optional[LayerMeta]:
         """Get information about a specific layer."""
-        return self.LAYER_INFO.get(layer_name, {})
-    
-    def get_all_layer_names(self) -> List[str]:
-        """Get list of all capturable layer names in order."""
-        return [
-            'conv1', 'relu1', 'pool1',
-            'conv2', 'relu2', 'pool2',
-            'conv3', 'relu3',
-            'conv4', 'relu4',
-            'conv5', 'relu5', 'pool5',
-            'fc6', 'relu6',
-            'fc7', 'relu7',
-            'fc8', 'softmax'
-        ]
+        return self.LAYER_INFO.get(layer_name)
+    
+    def get_all_layer_names(self) -> Tuple[str, ...]:
+        """Get all capturable layer names in order."""
+        return self.LAYER_ORDER
 
 
 # Global model instance (singleton pattern for efficiency)
 _model_instance: Optional[AlexNetVisualizer] = None
+_model_lock = threading.Lock()
 
 
-def get_model() -> AlexNetVisualizer:
-    """Get or create the global model instance."""
+def get_model(**kwargs) -> AlexNetVisualizer:
+    """
+    Get or create the global model instance.
+    
+    Args:
+        **kwargs: AlexNetVisualizer options, only used when creating the instance
+    """
     global _model_instance
     if _model_instance is None:
-        _model_instance = AlexNetVisualizer()
+        # Double-checked so concurrent first calls build the model only once
+        with _model_lock:
+            if _model_instance is None:
+                _model_instance = AlexNetVisualizer(**kwargs)
     return _model_instance
@@ -0,0 +1,38 @@
+"""Tests for the request decoding helpers of the API."""
+
+import base64
+import io
+
+import numpy as np
+from PIL import Image
+
+import main
+
+
+def _jpeg_base64(size: int) -> str:
+    """Base64 of a random size x size JPEG."""
+    pixels = np.random.default_rng(0).integers(0, 256, (size, size, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='JPEG')
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def test_large_jpeg_is_not_its_own_preview():
+    """A JPEG drafted down to the preview size is still resized and re-encoded."""
+    payload = _jpeg_base64(1600)
+    
+    image, _, preview = main._sync_decode(payload, preview=True, image_format='webp')
+    
+    assert max(image.size) <= 2 * main.PREVIEW_MAX_SIZE  # Reduced-scale decode
+    assert preview != payload
+    preview_image = Image.open(io.BytesIO(base64.b64decode(preview)))
+    assert max(preview_image.size) <= main.PREVIEW_MAX_SIZE
+
+
+def test_small_jpeg_is_its_own_preview():
+    """A JPEG within the preview size is returned as-is."""
+    payload = _jpeg_base64(200)
+    
+    _, _, preview = main._sync_decode('data:image/jpeg;base64,' + payload, preview=True)
+    
+    assert preview == payload
@@ -0,0 +1,69 @@
+"""Tests for the visualization utilities."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch
+
+import utils
+
+
+# Activation shapes of every hooked AlexNet layer for a 224x224 input
+ALEXNET_ACTIVATION_SHAPES = {
+    'conv1': (1, 64, 55, 55), 'relu1': (1, 64, 55, 55), 'pool1': (1, 64, 27, 27),
+    'conv2': (1, 192, 27, 27), 'relu2': (1, 192, 27, 27), 'pool2': (1, 192, 13, 13),
+    'conv3': (1, 384, 13, 13), 'relu3': (1, 384, 13, 13),
+    'conv4': (1, 256, 13, 13), 'relu4': (1, 256, 13, 13),
+    'conv5': (1, 256, 13, 13), 'relu5': (1, 256, 13, 13), 'pool5': (1, 256, 6, 6),
+    'fc6': (1, 4096), 'fc7': (1, 4096), 'fc8': (1, 1000),
+}
+
+
+@pytest.fixture
+def render_pool(monkeypatch):
+    """Force a multi-threaded render pool, even on a single-core machine."""
+    monkeypatch.setattr(utils, 'RENDER_WORKERS', 4)
+    utils._render_executor.cache_clear()
+    yield
+    utils._render_executor.cache_clear()
+
+
+def test_concurrent_render_with_numba_kernels(render_pool):
+    """All layers render concurrently on the pool with the Numba kernels."""
+    numba = pytest.importorskip('numba')
+    assert utils.numba is numba
+    
+    generator = torch.Generator().manual_seed(0)
+    activations = {
+        name: torch.randn(shape, generator=generator)
+        for name, shape in ALEXNET_ACTIVATION_SHAPES.items()
+    }
+    expected = {
+        name: utils.create_activation_visualization(activations, name, 16, 'PNG')
+        for name in activations
+    }
+    
+    # Several requests rendering at once, each on the shared pool
+    with ThreadPoolExecutor(max_workers=4) as requests:
+        results = list(requests.map(
+            lambda _: utils.create_all_activations_visualization(activations, format='PNG'),
+            range(8)
+        ))
+    
+    for result in results:
+        assert list(result) == list(activations)
+        for name, (image, metadata) in expected.items():
+            assert result[name] == {'image': image, 'metadata': metadata}
+
+
+@pytest.mark.skipif(utils.numba is None, reason='Numba is not installed')
+def test_numba_kernels_match_numpy():
+    """The Numba kernels produce the same uint8 maps as the NumPy fallbacks."""
+    maps = np.random.default_rng(0).standard_normal((13, 27, 27)).astype(np.float32)
+    maps[3] = 1.0  # Constant map
+    
+    np.testing.assert_allclose(utils._normalize_pack(maps), utils._normalize_pack_numpy(maps), atol=1)
+    np.testing.assert_allclose(
+        utils._normalize_tile(maps, 4, 2), utils._normalize_tile_numpy(maps, 4, 2), atol=1
+    )
@@ -7,40 +7,150 @@ images suitable for web visualization.
 
 import numpy as np
 import torch
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 import io
-import base64
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
+import os
+import functools
 import cv2
-from typing import List, Tuple, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Optional, Union
 
+try:
+    import numba
+except ImportError:  # Numba is optional; NumPy fallbacks are used without it
+    numba = None
 
-def tensor_to_image(tensor: torch.Tensor, normalize: bool = True) -> np.ndarray:
+try:
+    # SIMD (AVX2/NEON) base64 codec with the same API as the stdlib module
+    import pybase64 as base64
+except ImportError:  # pybase64 is optional; the stdlib codec is used without it
+    import base64
+
+
+def _colormap_lut(colormap: int, rgb: bool) -> np.ndarray:
+    """Build the (256, 1, 3) lookup table of an OpenCV colormap, in RGB or BGR order."""
+    lut = cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(-1, 1), colormap)
+    return np.ascontiguousarray(lut[..., ::-1]) if rgb else lut
+
+
+# Colormap lookup tables, built once. cv2.applyColorMap(img, lut) with a cached
+# table is several times faster than passing a colormap id, which rebuilds the
+# table on every call, and the RGB tables also save the BGR->RGB conversion.
+VIRIDIS_LUT_BGR = _colormap_lut(cv2.COLORMAP_VIRIDIS, rgb=False)
+VIRIDIS_LUT_RGB = _colormap_lut(cv2.COLORMAP_VIRIDIS, rgb=True)
+JET_LUT_RGB = _colormap_lut(cv2.COLORMAP_JET, rgb=True)
+
+
+# Threads rendering layers in parallel: the work is mostly NumPy/OpenCV/codec
+# code that releases the GIL. Follows the per-process core share set in main.
+RENDER_WORKERS = max(1, min(8, int(os.environ.get('OMP_NUM_THREADS', os.cpu_count() or 1))))
+
+
+@functools.lru_cache(maxsize=None)
+def _render_executor() -> ThreadPoolExecutor:
+    """Shared layer-rendering pool, created on first use."""
+    return ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix='render')
+
+
+# Quality of lossy JPEG visualizations
+JPEG_QUALITY = 85
+
+# zlib level of PNG visualizations: about half the CPU time of the default 6,
+# for output within a few percent of its size
+PNG_COMPRESSION = 3
+
+# Formats numpy_to_base64() encodes with OpenCV (faster than Pillow for both),
+# as (extension, parameters)
+_CV2_ENCODERS = {
+    'JPEG': ('.jpg', [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]),
+    'JPG': ('.jpg', [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]),
+    'PNG': ('.png', [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION]),
+}
+
+
+def _viridis_lut_for(format: str) -> Tuple[np.ndarray, bool]:
     """
-    Convert a single-channel tensor to a grayscale image.
+    Pick the Viridis lookup table in the channel order the encoder wants.
+    
+    OpenCV encoders take BGR and Pillow takes RGB, so colorizing in the
+    right order saves a channel swap before encoding.
     
     Args:
-        tensor: 2D tensor (H, W)
-        normalize: Whether to normalize to 0-255 range
+        format: Image format the colorized image will be encoded in
         
     Returns:
-        Grayscale image as numpy array (H, W) with values 0-255
+        Tuple of (lookup table, whether it produces BGR)
     """
-    img = tensor.cpu().numpy()
-    
-    if normalize:
-        # Normalize to 0-1 range
-        img = img - img.min()
-        if img.max() > 0:
-            img = img / img.max()
-        # Scale to 0-255
-        img = (img * 255).astype(np.uint8)
-    else:
-        img = np.clip(img, 0, 255).astype(np.uint8)
-    
-    return img
+    bgr = format.upper() in _CV2_ENCODERS
+    return (VIRIDIS_LUT_BGR if bgr else VIRIDIS_LUT_RGB), bgr
+
+
+def _normalize_pack_numpy(maps: np.ndarray) -> np.ndarray:
+    """Min-max normalize each (H, W) map of an (N, H, W) array to uint8."""
+    mn = maps.min(axis=(1, 2), keepdims=True)
+    rng = maps.max(axis=(1, 2), keepdims=True) - mn
+    scale = np.divide(255.0, rng, out=np.zeros_like(rng), where=rng > 0)
+    return ((maps - mn) * scale).astype(np.uint8)
+
+
+# The Numba kernels are serial: layers are already rendered concurrently on the
+# render pool, and parallel kernels launched from several threads oversubscribe
+# the cores (or abort the process under Numba's workqueue threading layer)
+if numba is not None:
+    @numba.njit(fastmath=True, cache=True)
+    def _normalize_pack(maps):
+        """Min-max normalize each (H, W) map of an (N, H, W) array to uint8."""
+        n, h, w = maps.shape
+        out = np.empty((n, h, w), dtype=np.uint8)
+        for i in range(n):
+            mn = maps[i].min()
+            mx = maps[i].max()
+            scale = 255.0 / (mx - mn) if mx > mn else 0.0
+            for y in range(h):
+                for x in range(w):
+                    out[i, y, x] = np.uint8((maps[i, y, x] - mn) * scale)
+        return out
+else:
+    _normalize_pack = _normalize_pack_numpy
+
+
+def _normalize_tile_numpy(maps: np.ndarray, grid_cols: int, padding: int) -> np.ndarray:
+    """Min-max normalize (N, H, W) maps to uint8 and tile them into a white grid."""
+    num_maps, height, width = maps.shape
+    grid_rows = (num_maps + grid_cols - 1) // grid_cols
+    
+    # Pad every cell on the bottom/right (white background, also filling unused
+    # cells), then tile them into the grid with a single copy
+    cells = np.full((grid_rows * grid_cols, height + padding, width + padding), 255, dtype=np.uint8)
+    cells[:num_maps, :height, :width] = _normalize_pack_numpy(maps)
+    grid = cells.reshape(grid_rows, grid_cols, height + padding, width + padding)
+    grid = grid.transpose(0, 2, 1, 3).reshape(grid_rows * (height + padding), -1)
+    
+    # Drop the padding after the last row and column
+    return np.ascontiguousarray(grid[:-padding or None, :-padding or None])
+
+
+if numba is not None:
+    @numba.njit(fastmath=True, cache=True)
+    def _normalize_tile(maps, grid_cols, padding):
+        """Min-max normalize (N, H, W) maps to uint8 and tile them into a white grid."""
+        n, h, w = maps.shape
+        grid_rows = (n + grid_cols - 1) // grid_cols
+        out = np.full((grid_rows * (h + padding) - padding, grid_cols * (w + padding) - padding),
+                      255, dtype=np.uint8)
+        # Each tile is normalized and written straight into its place in the grid
+        for i in range(n):
+            y0 = (i // grid_cols) * (h + padding)
+            x0 = (i % grid_cols) * (w + padding)
+            mn = maps[i].min()
+            mx = maps[i].max()
+            scale = 255.0 / (mx - mn) if mx > mn else 0.0
+            for y in range(h):
+                for x in range(w):
+                    out[y0 + y, x0 + x] = np.uint8((maps[i, y, x] - mn) * scale)
+        return out
+else:
+    _normalize_tile = _normalize_tile_numpy
 
 
 def feature_maps_to_grid(
@@ -65,64 +175,49 @@ def feature_maps_to_grid(
     if activation.dim() == 4:
         activation = activation[0]  # Take first batch item
     
-    # Get dimensions
-    num_channels, height, width = activation.shape
-    num_show = min(num_channels, max_maps)
-    
-    # Calculate grid dimensions
-    grid_rows = (num_show + grid_cols - 1) // grid_cols
-    
-    # Calculate output size
-    grid_height = grid_rows * (height + padding) - padding
-    grid_width = grid_cols * (width + padding) - padding
-    
-    # Create output grid (white background)
-    grid = np.ones((grid_height, grid_width), dtype=np.uint8) * 255
-    
-    # Fill grid with feature maps
-    for idx in range(num_show):
-        row = idx // grid_cols
-        col = idx % grid_cols
-        
-        y_start = row * (height + padding)
-        x_start = col * (width + padding)
-        
-        # Convert feature map to image
-        feature_img = tensor_to_image(activation[idx])
-        
-        # Place in grid
-        grid[y_start:y_start + height, x_start:x_start + width] = feature_img
+    num_show = min(activation.shape[0], max_maps)
     
-    return grid
+    # Normalize all shown maps with one host copy, and tile them in one pass
+    maps = np.ascontiguousarray(activation[:num_show].detach().float().cpu().numpy())
+    return _normalize_tile(maps, grid_cols, padding)
 
 
-def numpy_to_base64(img: np.ndarray, format: str = 'PNG') -> str:
+def numpy_to_base64(img: np.ndarray, format: str = 'WEBP', bgr: bool = False) -> str:
     """
     Convert numpy array to base64 encoded string.
     
     Args:
         img: Numpy array image (grayscale or RGB)
-        format: Image format ('PNG', 'JPEG', etc.)
+        format: Image format ('WEBP', 'PNG', 'JPEG', etc.)
+        bgr: Whether a color image is in OpenCV's BGR order, as returned
+            by cv2.applyColorMap
         
     Returns:
         Base64 encoded string
     """
+    color = img.ndim == 3
+    
+    encoder = _CV2_ENCODERS.get(format.upper())
+    if encoder is not None:
+        # OpenCV encodes straight from the array, without a PIL copy
+        if color and not bgr:
+            img = img[..., ::-1]
+        extension, params = encoder
+        ok, buffer = cv2.imencode(extension, img, params)
+        if not ok:
+            raise ValueError(f"{format} encoding failed")
+        return base64.b64encode(buffer).decode('utf-8')
+    
     # Convert to PIL Image
-    if len(img.shape) == 2:
+    if not color:
         pil_img = Image.fromarray(img, mode='L')
     else:
-        pil_img = Image.fromarray(img)
+        pil_img = Image.fromarray(img[..., ::-1] if bgr else img)
     
-    # Save to buffer
-    buffer = io.BytesIO()
-    pil_img.save(buffer, format=format)
-    buffer.seek(0)
-    
-    # Encode to base64
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return pil_to_base64(pil_img, format)
 
 
-def pil_to_base64(img: Image.Image, format: str = 'PNG') -> str:
+def pil_to_base64(img: Image.Image, format: str = 'WEBP') -> str:
     """
     Convert PIL Image to base64 encoded string.
     
@@ -134,33 +229,211 @@ def pil_to_base64(img: Image.Image, format: str = 'PNG') -> str:
         Base64 encoded string
     """
     buffer = io.BytesIO()
-    img.save(buffer, format=format)
+    if format.upper() == 'WEBP':
+        # method=0 is the fastest WebP encoder setting
+        img.save(buffer, format=format, quality=80, method=0)
+    elif format.upper() in ('JPEG', 'JPG'):
+        img.save(buffer, format='JPEG', quality=JPEG_QUALITY)
+    elif format.upper() == 'PNG':
+        img.save(buffer, format='PNG', compress_level=PNG_COMPRESSION)
+    else:
+        img.save(buffer, format=format)
     buffer.seek(0)
     return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
 
-def base64_to_pil(base64_str: str) -> Image.Image:
+def base64_to_pil(data: Union[str, bytes], load: bool = True) -> Image.Image:
     """
     Convert base64 string to PIL Image.
     
     Args:
-        base64_str: Base64 encoded image string
+        data: Base64 encoded image string (optionally a data URL), or the
+            already decoded image file bytes
+        load: Whether to decode the pixels now, which lets the buffer be
+            freed. Pass False to call Image.draft() before loading.
         
     Returns:
         PIL Image
     """
-    # Handle data URL format
-    if ',' in base64_str:
-        base64_str = base64_str.split(',')[1]
+    if isinstance(data, str):
+        # Handle data URL format
+        _, separator, payload = data.partition(',')
+        data = base64.b64decode(payload if separator else data)
+    
+    image = Image.open(io.BytesIO(data))
+    if load:
+        image.load()
+    return image
+
+
+# Chart colors, matching the frontend's dark theme
+CHART_BACKGROUND = (0x11, 0x18, 0x27)  # #111827
+CHART_PANEL = (0x1F, 0x29, 0x37)  # #1F2937
+CHART_BAR = (0x3B, 0x82, 0xF6)  # #3B82F6
+CHART_SPINE = (0x37, 0x41, 0x51)  # #374151
+CHART_TEXT = (0xFF, 0xFF, 0xFF)
+
+# Approximate display size of one filter in the filter visualization
+FILTER_TILE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _chart_font(size: int) -> ImageFont.ImageFont:
+    """Load Pillow's bundled font once per size."""
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def _nice_ticks(low: float, high: float, max_ticks: int = 6) -> np.ndarray:
+    """Round tick positions (steps of 1, 2 or 5 times a power of ten) covering [low, high]."""
+    span = high - low
+    magnitude = 10 ** np.floor(np.log10(span / max_ticks))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if span / (m * magnitude) <= max_ticks)
+    return np.arange(np.ceil(low / step) * step, high + step * 1e-6, step)
+
+
+def _format_tick(value: float) -> str:
+    """Format a tick label compactly, without a negative zero."""
+    return f'{value + 0.0:g}'
+
+
+def _draw_text(draw: ImageDraw.ImageDraw, xy: Tuple[float, float], text: str,
+               size: int, anchor: str = 'la'):
+    """Draw chart text, anchored at xy (Pillow anchor codes, e.g. 'mm' for centered)."""
+    font = _chart_font(size)
+    if isinstance(font, ImageFont.FreeTypeFont):
+        draw.text(xy, text, fill=CHART_TEXT, font=font, anchor=anchor)
+        return
+    
+    # Bitmap fonts do not support anchors, so align by the measured size
+    width, height = draw.textsize(text, font=font) if hasattr(draw, 'textsize') \
+        else draw.textbbox((0, 0), text, font=font)[2:]
+    x, y = xy
+    x -= {'l': 0, 'm': width / 2, 'r': width}[anchor[0]]
+    y -= {'a': 0, 't': 0, 'm': height / 2, 'b': height, 's': height}[anchor[1]]
+    draw.text((x, y), text, fill=CHART_TEXT, font=font)
+
+
+def _draw_vertical_text(image: Image.Image, center: Tuple[float, float], text: str, size: int):
+    """Draw text rotated by 90 degrees (reading bottom to top), centered at center."""
+    font = _chart_font(size)
+    left, top, right, bottom = ImageDraw.Draw(image).textbbox((0, 0), text, font=font)
+    label = Image.new('L', (right, bottom))
+    ImageDraw.Draw(label).text((0, 0), text, fill=255, font=font)
+    label = label.rotate(90, expand=True)
+    x = int(center[0] - label.width / 2)
+    y = int(center[1] - label.height / 2)
+    image.paste(CHART_TEXT, (x, y, x + label.width, y + label.height), label)
+
+
+def _fill_rects(canvas: np.ndarray, rects: np.ndarray, color: Tuple[int, int, int]):
+    """Fill (x0, y0, x1, y1) pixel rectangles of an RGB canvas with a solid color."""
+    for x0, y0, x1, y1 in rects:
+        canvas[y0:y1, x0:x1] = color
+
+
+# Layout of the FC activation chart: canvas size and plot area
+ACTIVATION_CHART_SIZE = (1000, 400)
+ACTIVATION_CHART_PLOT = (90, 40, 980, 340)  # left, top, right, bottom
+
+
+@functools.lru_cache(maxsize=8)
+def _activation_chart_frame(num_bars: int) -> np.ndarray:
+    """
+    Render the data-independent parts of the FC activation chart once.
     
-    image_data = base64.b64decode(base64_str)
-    return Image.open(io.BytesIO(image_data))
+    The background, plot panel and border, neuron index axis and axis labels
+    only depend on the number of bars, so each chart starts from a copy of
+    this frame instead of redrawing them (mostly text rasterization).
+    
+    Args:
+        num_bars: Number of bars in the chart
+        
+    Returns:
+        Read-only RGB array of the frame
+    """
+    width, height = ACTIVATION_CHART_SIZE
+    left, top, right, bottom = ACTIVATION_CHART_PLOT
+    
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = CHART_BACKGROUND
+    canvas[top:bottom, left:right] = CHART_PANEL
+    
+    image = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((left, top, right, bottom), outline=CHART_TEXT)
+    
+    # X ticks on neuron indices
+    slot = (right - left) / num_bars
+    for tick in _nice_ticks(0, num_bars - 1):
+        x = int(left + slot * (tick + 0.5))
+        draw.line((x, bottom, x, bottom + 5), fill=CHART_TEXT)
+        _draw_text(draw, (x, bottom + 8), _format_tick(tick), 12, anchor='mt')
+    
+    _draw_text(draw, ((left + right) / 2, height - 20), 'Neuron Index', 14, anchor='mm')
+    _draw_vertical_text(image, (20, (top + bottom) / 2), 'Activation Value', 14)
+    
+    frame = np.asarray(image)
+    frame.setflags(write=False)
+    return frame
+
+
+def _render_activation_chart(values: np.ndarray, title: str) -> Image.Image:
+    """
+    Render a bar chart of FC neuron activations without matplotlib.
+    
+    Bars are filled straight into a copy of the cached chart frame, and only
+    the value ticks and the title go through Pillow.
+    
+    Args:
+        values: 1D array of activation values, one bar each
+        title: Chart title
+        
+    Returns:
+        RGB PIL Image of the chart
+    """
+    left, top, right, bottom = ACTIVATION_CHART_PLOT
+    canvas = _activation_chart_frame(len(values)).copy()
+    
+    # Value range always includes zero, where the bars start
+    low = min(float(values.min()), 0.0)
+    high = max(float(values.max()), 0.0)
+    if high == low:
+        high = low + 1.0
+    low, high = low - 0.05 * (high - low) * (low < 0), high + 0.05 * (high - low)
+    
+    def to_y(v):
+        return np.rint(bottom - (np.asarray(v) - low) / (high - low) * (bottom - top)).astype(int)
+    
+    # Bars fill 80% of their slot
+    slot = (right - left) / len(values)
+    x0 = np.rint(left + slot * (np.arange(len(values)) + 0.1)).astype(int)
+    x1 = np.maximum(np.rint(x0 + slot * 0.8).astype(int), x0 + 1)
+    y_zero, y_value = to_y(0.0), to_y(values)
+    rects = np.stack([x0, np.minimum(y_zero, y_value), x1, np.maximum(y_zero, y_value)], axis=1)
+    _fill_rects(canvas, rects, CHART_BAR)
+    
+    image = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(image)
+    
+    # Y ticks on the value scale
+    for tick in _nice_ticks(low, high):
+        y = int(to_y(tick))
+        draw.line((left - 5, y, left, y), fill=CHART_TEXT)
+        _draw_text(draw, (left - 8, y), _format_tick(tick), 12, anchor='rm')
+    
+    _draw_text(draw, ((left + right) / 2, top / 2), title, 16, anchor='mm')
+    
+    return image
 
 
 def create_activation_visualization(
     activations: Dict[str, torch.Tensor],
     layer_name: str,
-    max_maps: int = 16
+    max_maps: int = 16,
+    format: str = 'WEBP'
 ) -> Tuple[str, Dict]:
     """
     Create visualization for a specific layer's activation.
@@ -169,6 +442,7 @@ def create_activation_visualization(
         activations: Dictionary of layer activations
         layer_name: Name of the layer to visualize
         max_maps: Maximum feature maps to show
+        format: Image format of the encoded visualization
         
     Returns:
         Tuple of (base64 image string, metadata dict)
@@ -182,38 +456,28 @@ def create_activation_visualization(
     if activation.dim() == 2:
         # FC layer output (B, features)
         # Create a bar-like visualization
-        values = activation[0].cpu().numpy()
-        num_show = min(len(values), 100)
-        
-        fig, ax = plt.subplots(figsize=(10, 4))
-        ax.bar(range(num_show), values[:num_show], color='#3B82F6')
-        ax.set_xlabel('Neuron Index')
-        ax.set_ylabel('Activation Value')
-        ax.set_title(f'{layer_name} Activations (first {num_show} neurons)')
-        ax.set_facecolor('#1F2937')
-        fig.patch.set_facecolor('#111827')
-        ax.tick_params(colors='white')
-        ax.xaxis.label.set_color('white')
-        ax.yaxis.label.set_color('white')
-        ax.title.set_color('white')
-        for spine in ax.spines.values():
-            spine.set_color('white')
-        
-        # Save to base64
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='PNG', bbox_inches='tight', facecolor='#111827')
-        buffer.seek(0)
-        plt.close()
-        
-        base64_img = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        neurons = activation[0]
+        num_show = min(len(neurons), 100)
+        
+        # Reduce on the tensor and read the statistics back in one transfer;
+        # only the plotted neurons are copied to NumPy
+        std, mean = torch.std_mean(neurons, correction=0)
+        low, high = torch.aminmax(neurons)
+        mean, std, high, low = torch.stack([mean, std, high, low]).tolist()
+        values = neurons[:num_show].cpu().numpy()
+        
+        chart = _render_activation_chart(
+            values, f'{layer_name} Activations (first {num_show} neurons)'
+        )
+        base64_img = pil_to_base64(chart, format)
         metadata = {
             'type': 'fc',
-            'num_neurons': len(values),
+            'num_neurons': len(neurons),
             'shape': list(activation.shape),
-            'mean': float(values.mean()),
-            'std': float(values.std()),
-            'max': float(values.max()),
-            'min': float(values.min())
+            'mean': mean,
+            'std': std,
+            'max': high,
+            'min': low
         }
         
     elif activation.dim() >= 3:
@@ -226,11 +490,11 @@ def create_activation_visualization(
         # Create grid visualization
         grid = feature_maps_to_grid(activation, max_maps=max_maps)
         
-        # Apply colormap for better visualization
-        colored = cv2.applyColorMap(grid, cv2.COLORMAP_VIRIDIS)
-        colored = cv2.cvtColor(colored, cv2.COLOR_BGR2RGB)
+        # Apply colormap for better visualization, in the encoder's channel order
+        lut, bgr = _viridis_lut_for(format)
+        colored = cv2.applyColorMap(grid, lut)
         
-        base64_img = numpy_to_base64(colored)
+        base64_img = numpy_to_base64(colored, format, bgr=bgr)
         metadata = {
             'type': 'conv',
             'num_channels': num_channels,
@@ -246,7 +510,8 @@ def create_activation_visualization(
 
 def create_all_activations_visualization(
     activations: Dict[str, torch.Tensor],
-    max_maps: int = 16
+    max_maps: int = 16,
+    format: str = 'WEBP'
 ) -> Dict[str, Dict]:
     """
     Create visualizations for all layer activations.
@@ -254,17 +519,24 @@ def create_all_activations_visualization(
     Args:
         activations: Dictionary of layer activations
         max_maps: Maximum feature maps to show per layer
+        format: Image format of the encoded visualizations
         
     Returns:
         Dictionary with layer names as keys, containing image and metadata
     """
     result = {}
     
-    for layer_name, activation in activations.items():
-        base64_img, metadata = create_activation_visualization(
-            activations, layer_name, max_maps
-        )
-        
+    # Render the layers concurrently (inline on a single core); map() keeps
+    # the layer order
+    mapper = _render_executor().map if RENDER_WORKERS > 1 else map
+    rendered = mapper(
+        lambda layer_name: create_activation_visualization(
+            activations, layer_name, max_maps, format
+        ),
+        activations
+    )
+    
+    for layer_name, (base64_img, metadata) in zip(activations, rendered):
         if base64_img:
             result[layer_name] = {
                 'image': base64_img,
@@ -274,6 +546,19 @@ def create_all_activations_visualization(
     return result
 
 
+def colorize_heatmap(heatmap: np.ndarray) -> np.ndarray:
+    """
+    Color a heatmap with the JET colormap.
+    
+    Args:
+        heatmap: Heatmap (H, W) with values in [0, 1]
+        
+    Returns:
+        RGB image as numpy array (H, W, 3)
+    """
+    return cv2.applyColorMap((heatmap * 255).astype(np.uint8), JET_LUT_RGB)
+
+
 def create_gradcam_overlay(
     original_image: Image.Image,
     heatmap: np.ndarray,
@@ -290,20 +575,18 @@ def create_gradcam_overlay(
     Returns:
         PIL Image with overlay
     """
-    # Resize original to 224x224 (AlexNet input size)
-    original = original_image.copy()
-    if original.mode != 'RGB':
-        original = original.convert('RGB')
-    original = original.resize((224, 224))
-    original_np = np.array(original)
+    # Resize original to the heatmap size (224x224, the AlexNet input size);
+    # the heatmap is already upsampled on the device, so only one resize is needed
+    original = original_image if original_image.mode == 'RGB' else original_image.convert('RGB')
+    height, width = heatmap.shape[:2]
+    original_np = cv2.resize(np.asarray(original), (width, height),
+                             interpolation=cv2.INTER_LINEAR)
     
-    # Apply colormap to heatmap
-    heatmap_uint8 = (heatmap * 255).astype(np.uint8)
-    heatmap_colored = cv2.applyColorMap(heatmap_uint8, cv2.COLORMAP_JET)
-    heatmap_colored = cv2.cvtColor(heatmap_colored, cv2.COLOR_BGR2RGB)
+    # Apply colormap to heatmap (the Jet LUT already yields RGB)
+    heatmap_colored = colorize_heatmap(heatmap)
     
-    # Blend images
-    overlay = (alpha * heatmap_colored + (1 - alpha) * original_np).astype(np.uint8)
+    # Blend images in uint8 without float intermediates
+    overlay = cv2.addWeighted(heatmap_colored, alpha, original_np, 1.0 - alpha, 0.0)
     
     return Image.fromarray(overlay)
 
@@ -325,81 +608,104 @@ def create_filter_visualization(
         Base64 encoded image string
     """
     num_filters = min(weights.shape[0], max_filters)
+    filters = weights[:num_filters]
     
-    # For first layer, we can show RGB filters directly
-    if weights.shape[1] == 3:  # RGB input
-        grid_cols = 4
-        grid_rows = (num_filters + grid_cols - 1) // grid_cols
-        
-        fig, axes = plt.subplots(grid_rows, grid_cols, figsize=(12, 3 * grid_rows))
-        fig.patch.set_facecolor('#111827')
-        
-        for idx in range(num_filters):
-            row = idx // grid_cols
-            col = idx % grid_cols
-            ax = axes[row, col] if grid_rows > 1 else axes[col]
-            
-            # Get filter and normalize
-            filt = weights[idx].transpose(1, 2, 0)  # (H, W, C)
-            filt = (filt - filt.min()) / (filt.max() - filt.min() + 1e-8)
-            
-            ax.imshow(filt)
-            ax.set_title(f'Filter {idx}', color='white', fontsize=8)
-            ax.axis('off')
-        
-        # Hide unused subplots
-        for idx in range(num_filters, grid_rows * grid_cols):
-            row = idx // grid_cols
-            col = idx % grid_cols
-            ax = axes[row, col] if grid_rows > 1 else axes[col]
-            ax.axis('off')
-        
-        plt.tight_layout()
-        
+    if filters.shape[1] == 3:
+        # For first layer, we can show RGB filters directly
+        filters = filters.transpose(0, 2, 3, 1).astype(np.float32, order='C')  # (N, H, W, C)
     else:
-        # For deeper layers, show as grayscale mean across input channels
-        grid_cols = 4
-        grid_rows = (num_filters + grid_cols - 1) // grid_cols
-        
-        fig, axes = plt.subplots(grid_rows, grid_cols, figsize=(12, 3 * grid_rows))
-        fig.patch.set_facecolor('#111827')
-        
-        for idx in range(num_filters):
-            row = idx // grid_cols
-            col = idx % grid_cols
-            
-            if grid_rows == 1:
-                ax = axes[col] if grid_cols > 1 else axes
-            else:
-                ax = axes[row, col]
-            
-            # Average across input channels
-            filt = weights[idx].mean(axis=0)
-            filt = (filt - filt.min()) / (filt.max() - filt.min() + 1e-8)
-            
-            ax.imshow(filt, cmap='viridis')
-            ax.set_title(f'Filter {idx}', color='white', fontsize=8)
-            ax.axis('off')
-        
-        # Hide unused subplots
-        for idx in range(num_filters, grid_rows * grid_cols):
-            row = idx // grid_cols
-            col = idx % grid_cols
-            if grid_rows == 1:
-                ax = axes[col] if grid_cols > 1 else axes
-            else:
-                ax = axes[row, col]
-            ax.axis('off')
+        # For deeper layers, show the mean across input channels
+        filters = filters.mean(axis=1, dtype=np.float32)  # (N, H, W)
+    
+    # Normalize every filter to [0, 255] at once, in place on the fresh
+    # float32 copy, viewed as one row per filter
+    flat = filters.reshape(num_filters, -1)
+    low = flat.min(axis=1, keepdims=True)
+    flat -= low
+    flat *= 255 / np.maximum(flat.max(axis=1, keepdims=True), 1e-8)
+    filters = filters.astype(np.uint8)
+    
+    if filters.ndim == 3:
+        # Colorize all filters in one call on the stacked (N * H, W) image
+        n, h, w = filters.shape
+        colored = cv2.applyColorMap(filters.reshape(n * h, w), VIRIDIS_LUT_RGB)
+        filters = colored.reshape(n, h, w, 3)
+    
+    # Upscale to roughly FILTER_TILE_SIZE pixels with nearest neighbour, keeping
+    # individual weights visible as blocks
+    scale = max(1, FILTER_TILE_SIZE // filters.shape[1])
+    tiles = filters.repeat(scale, axis=1).repeat(scale, axis=2)
+    _, tile_h, tile_w, _ = tiles.shape
+    
+    # Lay the tiles out in cells with room for a caption above each one
+    grid_cols = 4
+    grid_rows = (num_filters + grid_cols - 1) // grid_cols
+    caption, pad = 24, 16
+    cell_h, cell_w = caption + tile_h + pad, tile_w + pad
+    
+    cells = np.empty((grid_rows * grid_cols, cell_h, cell_w, 3), dtype=np.uint8)
+    cells[:] = CHART_BACKGROUND
+    cells[:num_filters, caption:caption + tile_h, pad // 2:pad // 2 + tile_w] = tiles
+    grid = cells.reshape(grid_rows, grid_cols, cell_h, cell_w, 3)
+    grid = grid.transpose(0, 2, 1, 3, 4).reshape(grid_rows * cell_h, grid_cols * cell_w, 3)
+    
+    image = Image.fromarray(grid)
+    draw = ImageDraw.Draw(image)
+    for idx in range(num_filters):
+        row, col = divmod(idx, grid_cols)
+        _draw_text(draw, (col * cell_w + cell_w / 2, row * cell_h + caption / 2),
+                   f'Filter {idx}', 12, anchor='mm')
+    
+    return pil_to_base64(image, 'PNG')
+
+
+# PNG parameters of the probability chart: it is flat colour, so skipping the
+# per-row filter search (OpenCV >= 4.11) costs a few percent in size for about
+# a third of the encode time
+_CHART_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION] + (
+    [cv2.IMWRITE_PNG_FILTER, cv2.IMWRITE_PNG_FILTER_NONE]
+    if hasattr(cv2, 'IMWRITE_PNG_FILTER') else []
+)
+
+PROBABILITY_CHART_SIZE = (1000, 600)
+PROBABILITY_CHART_PLOT = (60, 960, 540)  # top, right, bottom; left follows the labels
+
+
+@functools.lru_cache(maxsize=32)
+def _probability_chart_frame(left: int) -> np.ndarray:
+    """
+    Render the data-independent parts of the probability chart once.
+    
+    The background, plot panel, confidence axis, title and axis label only
+    depend on where the plot starts, which follows the widest class label.
+    
+    Args:
+        left: X coordinate of the left edge of the plot area
         
-        plt.tight_layout()
+    Returns:
+        Read-only RGB array of the frame
+    """
+    width, height = PROBABILITY_CHART_SIZE
+    top, right, bottom = PROBABILITY_CHART_PLOT
     
-    # Save to base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='PNG', bbox_inches='tight', facecolor='#111827')
-    buffer.seek(0)
-    plt.close()
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = CHART_BACKGROUND
+    canvas[top:bottom, left:right] = CHART_PANEL
     
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    image = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(image)
+    
+    for tick in range(0, 101, 20):
+        x = left + tick / 100 * (right - left)
+        draw.line((x, bottom, x, bottom + 5), fill=CHART_TEXT)
+        _draw_text(draw, (x, bottom + 8), str(tick), 13, anchor='mt')
+    
+    _draw_text(draw, ((left + right) / 2, top / 2), 'Top 5 Predictions', 18, anchor='mm')
+    _draw_text(draw, ((left + right) / 2, height - 20), 'Confidence (%)', 14, anchor='mm')
+    
+    frame = np.asarray(image)
+    frame.setflags(write=False)
+    return frame
 
 
 def create_probability_chart(
@@ -419,46 +725,43 @@ def create_probability_chart(
     predictions = predictions[:top_n]
     
     labels = [p[0] for p in predictions]
-    probs = [p[1] * 100 for p in predictions]  # Convert to percentage
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    fig.patch.set_facecolor('#111827')
-    ax.set_facecolor('#1F2937')
-    
-    # Create horizontal bar chart
-    bars = ax.barh(range(len(labels)), probs, color='#3B82F6', height=0.6)
-    
-    # Customize appearance
-    ax.set_yticks(range(len(labels)))
-    ax.set_yticklabels(labels, fontsize=12)
-    ax.set_xlabel('Confidence (%)', fontsize=12, color='white')
-    ax.set_title('Top 5 Predictions', fontsize=14, color='white', pad=20)
-    ax.set_xlim(0, 100)
-    
-    # Style ticks and spines
-    ax.tick_params(colors='white')
-    for spine in ax.spines.values():
-        spine.set_color('#374151')
-    
-    # Add percentage labels on bars
-    for bar, prob in zip(bars, probs):
-        ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                f'{prob:.1f}%', va='center', color='white', fontsize=10)
-    
-    plt.tight_layout()
-    
-    # Save to base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='PNG', bbox_inches='tight', facecolor='#111827')
-    buffer.seek(0)
-    plt.close()
-    
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    probs = np.array([p[1] * 100 for p in predictions])  # Convert to percentage
+    
+    measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+    label_width = max((measure.textlength(label, font=_chart_font(14)) for label in labels), default=0)
+    left = int(label_width) + 30
+    top, right, bottom = PROBABILITY_CHART_PLOT  # Plot area
+    
+    # Start from the cached frame; only bars and labels are drawn per call
+    canvas = _probability_chart_frame(left).copy()
+    
+    # One row per prediction, top to bottom; bars fill 60% of their row
+    row = (bottom - top) / max(len(labels), 1)
+    centers = top + row * (np.arange(len(labels)) + 0.5)
+    y0 = np.rint(centers - row * 0.3).astype(int)
+    y1 = np.rint(centers + row * 0.3).astype(int)
+    x1 = np.rint(left + np.clip(probs, 0, 100) / 100 * (right - left)).astype(int)
+    _fill_rects(canvas, np.stack([np.full_like(x1, left), y0, x1, y1], axis=1), CHART_BAR)
+    
+    image = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((left, top, right, bottom), outline=CHART_SPINE)
+    
+    for label, prob, center, bar_end in zip(labels, probs, centers, x1):
+        _draw_text(draw, (left - 10, center), label, 14, anchor='rm')
+        # Percentage label just right of the bar
+        _draw_text(draw, (bar_end + 10, center), f'{prob:.1f}%', 13, anchor='lm')
+    
+    ok, buffer = cv2.imencode('.png', np.asarray(image)[..., ::-1], _CHART_PNG_PARAMS)
+    if not ok:
+        raise ValueError("PNG encoding failed")
+    return base64.b64encode(buffer).decode('utf-8')
 
 
 def create_individual_feature_maps(
     activation: torch.Tensor,
-    max_maps: int = 16
+    max_maps: int = 16,
+    format: str = 'WEBP'
 ) -> List[str]:
     """
     Create individual base64 images for each feature map.
@@ -466,6 +769,7 @@ def create_individual_feature_maps(
     Args:
         activation: Tensor of shape (B, C, H, W) or (C, H, W)
         max_maps: Maximum number of feature maps to return
+        format: Image format of the encoded maps
         
     Returns:
         List of base64 encoded image strings
@@ -476,17 +780,23 @@ def create_individual_feature_maps(
     num_channels = activation.shape[0]
     num_show = min(num_channels, max_maps)
     
-    images = []
-    for i in range(num_show):
-        feature_img = tensor_to_image(activation[i])
-        
-        # Apply colormap
-        colored = cv2.applyColorMap(feature_img, cv2.COLORMAP_VIRIDIS)
-        colored = cv2.cvtColor(colored, cv2.COLOR_BGR2RGB)
-        
-        images.append(numpy_to_base64(colored))
-    
-    return images
+    # Normalize all shown maps to uint8 in one pass
+    maps = np.ascontiguousarray(
+        activation[:num_show].detach().float().cpu().numpy()
+    )
+    if maps.ndim < 3:
+        # FC layer: show each row of neurons as a one-pixel-high strip
+        maps = maps.reshape(maps.shape[0], 1, -1)
+    packed = _normalize_pack(maps)
+    
+    # Colorize every map with one call on the stacked (N * H, W) image, in the
+    # encoder's channel order; the per-map tiles are views into the result
+    num_maps, height, width = packed.shape
+    lut, bgr = _viridis_lut_for(format)
+    colored = cv2.applyColorMap(packed.reshape(num_maps * height, width), lut)
+    colored = colored.reshape(num_maps, height, width, 3)
+    
+    return [numpy_to_base64(tile, format, bgr=bgr) for tile in colored]
 
 
 def resize_image_for_preview(image: Image.Image, max_size: int = 400) -> Image.Image:
@@ -503,5 +813,9 @@ def resize_image_for_preview(image: Image.Image, max_size: int = 400) -> Image.I
     ratio = min(max_size / image.width, max_size / image.height)
     if ratio < 1:
         new_size = (int(image.width * ratio), int(image.height * ratio))
-        return image.resize(new_size, Image.Resampling.LANCZOS)
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        # Area averaging is much cheaper than LANCZOS and alias-free for shrinking
+        resized = cv2.resize(np.asarray(image), new_size, interpolation=cv2.INTER_AREA)
+        return Image.fromarray(resized, image.mode)
     return image
@@ -2,6 +2,8 @@ import { motion } from 'framer-motion'
 import { useState } from 'react'
 import { FaExpand, FaTimes, FaLayerGroup } from 'react-icons/fa'
 
+import { toImageDataUrl } from '../services/api'
+
 function FeatureMapGrid({ layerName, imageData, metadata, onSelect }) {
   const [selectedMap, setSelectedMap] = useState(null)
 
@@ -40,7 +42,7 @@ function FeatureMapGrid({ layerName, imageData, metadata, onSelect }) {
       {/* Feature Map Image */}
       <div className="relative overflow-hidden rounded-lg bg-black/30">
         <img
-          src={`data:image/png;base64,${imageData}`}
+          src={toImageDataUrl(imageData)}
           alt={`${layerName} feature maps`}
           className="w-full h-auto object-contain transition-transform duration-300 
                    group-hover:scale-105"
@@ -90,7 +92,7 @@ function FeatureMapGrid({ layerName, imageData, metadata, onSelect }) {
               <FaTimes className="text-white" />
             </button>
             <img
-              src={`data:image/png;base64,${selectedMap}`}
+              src={toImageDataUrl(selectedMap)}
               alt="Enlarged feature map"
               className="rounded-xl shadow-2xl"
             />
@@ -6,7 +6,7 @@ import { FaArrowLeft, FaFire, FaEye, FaInfoCircle } from 'react-icons/fa'
 import ComparisonSlider from '../components/ComparisonSlider'
 import { ExplanationCard } from '../components/TooltipExplanation'
 import LoadingSpinner from '../components/LoadingSpinner'
-import { computeGradCAM } from '../services/api'
+import { computeGradCAM, toImageDataUrl } from '../services/api'
 
 function GradCAMPage({ uploadedImage, predictionResults }) {
   const navigate = useNavigate()
@@ -111,7 +111,7 @@ function GradCAMPage({ uploadedImage, predictionResults }) {
                   {uploadedImage?.preview && (
                     <ComparisonSlider
                       beforeImage={uploadedImage.preview}
-                      afterImage={`data:image/png;base64,${gradcamData.overlay}`}
+                      afterImage={toImageDataUrl(gradcamData.overlay)}
                       beforeLabel="Original"
                       afterLabel="Grad-CAM"
                     />
@@ -146,7 +146,7 @@ function GradCAMPage({ uploadedImage, predictionResults }) {
                   >
                     <h4 className="text-sm font-medium text-gray-400 mb-3">Heatmap</h4>
                     <img
-                      src={`data:image/png;base64,${gradcamData.heatmap}`}
+                      src={toImageDataUrl(gradcamData.heatmap)}
                       alt="Heatmap"
                       className="w-full rounded-lg"
                     />
@@ -161,7 +161,7 @@ function GradCAMPage({ uploadedImage, predictionResults }) {
                   >
                     <h4 className="text-sm font-medium text-gray-400 mb-3">Overlay</h4>
                     <img
-                      src={`data:image/png;base64,${gradcamData.overlay}`}
+                      src={toImageDataUrl(gradcamData.overlay)}
                       alt="Overlay"
                       className="w-full rounded-lg"
                     />
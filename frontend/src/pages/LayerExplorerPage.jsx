@@ -7,7 +7,7 @@ import LayerSlider from '../components/LayerSlider'
 import LayerInfo from '../components/LayerInfo'
 import FeatureMapGrid from '../components/FeatureMapGrid'
 import { ExplanationCard } from '../components/TooltipExplanation'
-import { getLayers } from '../services/api'
+import { getLayers, toImageDataUrl } from '../services/api'
 
 // Layer information data
 const LAYER_DATA = {
@@ -225,7 +225,7 @@ function LayerExplorerPage({ predictionResults, uploadedImage }) {
               )}
               {predictionResults.original_image && !uploadedImage?.preview && (
                 <img
-                  src={`data:image/png;base64,${predictionResults.original_image}`}
+                  src={toImageDataUrl(predictionResults.original_image)}
                   alt="Original"
                   className="w-full rounded-lg"
                 />
@@ -271,7 +271,7 @@ function LayerExplorerPage({ predictionResults, uploadedImage }) {
                     className="rounded-xl overflow-hidden bg-black/30"
                   >
                     <img
-                      src={`data:image/png;base64,${currentActivation.image}`}
+                      src={toImageDataUrl(currentActivation.image)}
                       alt={`${currentLayer} activation`}
                       className="w-full h-auto"
                     />
@@ -363,7 +363,7 @@ function LayerExplorerPage({ predictionResults, uploadedImage }) {
               >
                 {data.image && (
                   <img
-                    src={`data:image/png;base64,${data.image}`}
+                    src={toImageDataUrl(data.image)}
                     alt={layer}
                     className="w-full rounded-lg mb-2"
                   />
@@ -399,7 +399,7 @@ function LayerExplorerPage({ predictionResults, uploadedImage }) {
                   <FaTimes className="text-white" />
                 </button>
                 <img
-                  src={`data:image/png;base64,${expandedImage}`}
+                  src={toImageDataUrl(expandedImage)}
                   alt="Expanded feature map"
                   className="rounded-xl shadow-2xl"
                 />
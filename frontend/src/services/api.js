@@ -137,4 +137,19 @@ export const getArchitecture = async () => {
   return response.data
 }
 
+/**
+ * Build a data URL for a base64 image returned by the API
+ * The MIME type is read from the image's magic bytes (PNG, JPEG or WebP)
+ * @param {string} imageBase64 - Base64 encoded image
+ */
+export const toImageDataUrl = (imageBase64) => {
+  let mimeType = 'image/png'
+  if (imageBase64?.startsWith('UklGR')) {
+    mimeType = 'image/webp'
+  } else if (imageBase64?.startsWith('/9j/')) {
+    mimeType = 'image/jpeg'
+  }
+  return `data:${mimeType};base64,${imageBase64}`
+}
+
 export default api